@@ -6,6 +6,7 @@ import json
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
@@ -30,6 +31,11 @@ class JournalEntry:
     encrypted: bool = False
     metadata: Dict[str, str] = None
 
+    @cached_property
+    def when(self) -> datetime:
+        """``timestamp`` parsed once per entry."""
+        return datetime.fromisoformat(self.timestamp)
+
     def serialise(self) -> Dict[str, object]:
         data = asdict(self)
         data["tags"] = self.tags or []
@@ -141,8 +147,10 @@ def export_entries(
     format: str = "markdown",
     cipher: Optional[Fernet] = None,
     password: Optional[str] = None,
+    entries: Optional[Iterable[JournalEntry]] = None,
 ) -> Path:
-    entries = load_entries(cipher=cipher, password=password)
+    if entries is None:
+        entries = load_entries(cipher=cipher, password=password)
     if format.lower() in {"markdown", "md"}:
         lines = ["# Solace journal export", ""]
         for entry in entries:
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import argparse
+import atexit
 import shutil
 import sys
+import time
 from collections.abc import Iterable
 from contextlib import contextmanager
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Callable, Dict, Optional
 
@@ -57,23 +60,29 @@ settings_controller = SettingsController(CONTEXT)
 class VoiceIO:
     def __init__(self, config: dict) -> None:
         self.config = config
-        self.engine = None
-        self.recogniser = None
-        try:  # TTS
+
+    @cached_property
+    def engine(self):
+        # Built on first use so importing the CLI never waits on the TTS driver.
+        try:
             if self.config.get("voice", {}).get("tts"):
                 import pyttsx3
 
-                self.engine = pyttsx3.init()
+                return pyttsx3.init()
         except Exception:  # noqa: BLE001 - best effort only
-            self.engine = None
+            pass
+        return None
 
-        try:  # STT
+    @cached_property
+    def recogniser(self):
+        try:
             if self.config.get("voice", {}).get("stt"):
                 import speech_recognition as sr
 
-                self.recogniser = sr.Recognizer()
+                return sr.Recognizer()
         except Exception:  # noqa: BLE001
-            self.recogniser = None
+            pass
+        return None
 
     def speak(self, text: str) -> None:
         if not text or not self.engine:
@@ -114,10 +123,28 @@ def _defaulting_prompts(enabled: bool) -> Iterable[None]:
         PROMPT_DEFAULTS_ONLY = previous
 
 
+_SESSION_LOG_HANDLE = None
+
+
+def _session_log_handle():
+    # One buffered append handle per process instead of an open/close per event.
+    global _SESSION_LOG_HANDLE
+    if _SESSION_LOG_HANDLE is None:
+        SESSION_LOG.parent.mkdir(parents=True, exist_ok=True)
+        _SESSION_LOG_HANDLE = SESSION_LOG.open("a", encoding="utf-8", buffering=8192)
+        atexit.register(_SESSION_LOG_HANDLE.close)
+    return _SESSION_LOG_HANDLE
+
+
+def _flush_session_log() -> None:
+    if _SESSION_LOG_HANDLE is not None:
+        _SESSION_LOG_HANDLE.flush()
+
+
 def _log_event(kind: str, content: str) -> None:
-    SESSION_LOG.parent.mkdir(parents=True, exist_ok=True)
-    with SESSION_LOG.open("a", encoding="utf-8") as handle:
-        handle.write(f"{datetime.now().isoformat(timespec='seconds')}\t{kind}\t{content}\n")
+    _session_log_handle().write(
+        f"{time.strftime('%Y-%m-%dT%H:%M:%S')}\t{kind}\t{content}\n"
+    )
 
 
 def _prompt_datetime() -> datetime:
@@ -257,6 +284,7 @@ def _handle_backup(args: str) -> None:
                 include_restore_point=include_restore,
                 allow_overwrite=allow_overwrite,
                 dry_run=dry_run,
+                incremental=False,
             )
         except sync_service.SyncConflictError as conflict:
             if _confirm_overwrite(_conflict_target(conflict)):
@@ -268,6 +296,7 @@ def _handle_backup(args: str) -> None:
                     include_restore_point=include_restore,
                     allow_overwrite=True,
                     dry_run=dry_run,
+                    incremental=False,
                 )
             else:
                 console.print("[yellow]Backup cancelled to keep existing file.[/]")
@@ -334,6 +363,9 @@ def _handle_sync(args: str) -> None:
     if result.dry_run:
         console.print(Panel(f"Dry run complete. Data would sync to {destination}.", title="Sync"))
         return
+    if result.unchanged:
+        console.print(Panel(f"Journal unchanged since the last sync to {destination}.", title="Sync"))
+        return
     restore_label = "yes" if include_restore else "no"
     message = f"Journal synced via {result.backend}. Restore point included: {restore_label}.\nTarget: {destination}"
     console.print(Panel(message, title="Sync"))
@@ -601,6 +633,7 @@ def run_commands(commands: Iterable[str], *, accept_defaults: bool = False) -> N
                 console.print("[green]Take care.[/]")
                 break
 
+    _flush_session_log()
     console.print(f"[cyan]Session log stored at {SESSION_LOG}[/]")
 
 
@@ -620,6 +653,7 @@ def run_cli() -> None:
         if not _process_command(raw):
             break
 
+    _flush_session_log()
     console.print(f"[cyan]Session log stored at {SESSION_LOG}[/]")
 
 
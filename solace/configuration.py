@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import getpass
 import hashlib
+import hmac
 import json
 import os
 from pathlib import Path
@@ -57,6 +58,9 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "backend": "local",
         "dry_run": True,
         "restore_point": True,
+        "incremental": False,
+        "full_every": 10,
+        "compresslevel": 1,
         "local": {
             "path": str(STORAGE_DIR / "backups"),
         },
@@ -67,6 +71,8 @@ DEFAULT_CONFIG: Dict[str, Any] = {
             "region": "",
             "endpoint": "",
             "profile": "",
+            "max_concurrency": 10,
+            "multipart_threshold": 8 * 1024 * 1024,
         },
         "webdav": {
             "enabled": False,
@@ -188,9 +194,13 @@ def verify_password(config: Dict[str, Any]) -> str | None:
     stored_hash = security.get("password_hash") or ""
     if not stored_hash:
         return None
+    try:
+        stored_digest = bytes.fromhex(stored_hash)
+    except ValueError:
+        stored_digest = b""  # malformed hash: no guess can match
     for _attempt in range(3):
         guess = getpass.getpass("Enter Solace password: ")
-        if hashlib.sha256(guess.encode("utf-8")).hexdigest() == stored_hash:
+        if hmac.compare_digest(hashlib.sha256(guess.encode("utf-8")).digest(), stored_digest):
             return guess
         print("Incorrect password. Try again.")
     raise PermissionError("Maximum password attempts exceeded")
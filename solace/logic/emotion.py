@@ -1,3 +1,5 @@
+import re
+
 MOOD_KEYWORDS = {
     'happy': ['happy', 'glad', 'joy', 'excited', 'great'],
     'sad': ['sad', 'down', 'unhappy', 'depressed', 'bad'],
@@ -5,10 +7,25 @@ MOOD_KEYWORDS = {
     'anxious': ['worried', 'anxious', 'nervous', 'scared'],
 }
 
+_MOOD_ORDER = {mood: rank for rank, mood in enumerate(MOOD_KEYWORDS)}
+# Zero-width lookahead so overlapping keywords ("unhappy"/"happy") all match.
+_MOOD_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{mood}>{'|'.join(map(re.escape, words))})"
+        for mood, words in MOOD_KEYWORDS.items()
+    ) + ")"
+)
+
+
 def detect_mood(text: str) -> str:
-    lower = text.lower()
-    for mood, words in MOOD_KEYWORDS.items():
-        for w in words:
-            if w in lower:
-                return mood
-    return 'neutral'
+    # Moods earlier in MOOD_KEYWORDS win regardless of where they appear.
+    # Matched against text.lower() like the substring checks it replaced;
+    # re.IGNORECASE folds more characters (e.g. "ſ" matches "s").
+    best = None
+    for match in _MOOD_RE.finditer(text.lower()):
+        mood = match.lastgroup
+        if best is None or _MOOD_ORDER[mood] < _MOOD_ORDER[best]:
+            best = mood
+            if _MOOD_ORDER[mood] == 0:
+                break
+    return best or 'neutral'
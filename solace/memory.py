@@ -64,12 +64,15 @@ def _extract_date_hint(query: str) -> str | None:
     return None
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _normalise(text: str) -> str:
-    return re.sub(r"\s+", " ", text.lower()).strip()
+    return _WHITESPACE_RE.sub(" ", text.lower()).strip()
 
 
-def _score_text(query: str, text: str) -> float:
-    return SequenceMatcher(None, _normalise(query), _normalise(text)).ratio()
+def _score_text(normalised_query: str, text: str) -> float:
+    return SequenceMatcher(None, normalised_query, _normalise(text)).ratio()
 
 
 def search_entries(query: str, entries: Iterable[JournalEntry], *, limit: int = 5) -> List[MemoryHit]:
@@ -77,11 +80,12 @@ def search_entries(query: str, entries: Iterable[JournalEntry], *, limit: int =
     if not query:
         return []
     date_hint = _extract_date_hint(query)
+    normalised_query = _normalise(query)
     hits: List[MemoryHit] = []
     for entry in entries:
-        score = _score_text(query, entry.content)
+        score = _score_text(normalised_query, entry.content)
         if entry.tags:
-            score = max(score, _score_text(query, " ".join(entry.tags)))
+            score = max(score, _score_text(normalised_query, " ".join(entry.tags)))
         matched_date = False
         if date_hint and entry.date == date_hint:
             matched_date = True
@@ -3,15 +3,29 @@
 from __future__ import annotations
 
 import base64
+import hashlib
+import io
 import json
+import queue
 import shutil
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Dict, List, Optional, Tuple
+from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 from solace.configuration import get_cipher, get_storage_path, load_config
+from solace.utils import jsontools
+
+try:
+    from zlib_ng import zlib_ng
+except Exception:  # noqa: BLE001 - optional speedup
+    zlib_ng = None
 
 
 @dataclass
@@ -22,10 +36,36 @@ class SyncResult:
     backend: str
     remote_target: Optional[str] = None
     dry_run: bool = False
+    unchanged: bool = False
+
 
+@contextmanager
+def _zlib_ng_codecs():
+    """Route ``zipfile`` DEFLATE and CRC-32 through zlib-ng while writing.
+
+    zlib-ng is a drop-in replacement for zlib with SIMD-accelerated CRC-32 and
+    match finding, so archives stay byte-compatible with stock readers.
+    ``zipfile`` looks both up as module globals, so the swap is process-wide
+    for the duration of the block; anything zipped meanwhile stays standard.
+    """
+
+    if zlib_ng is None or zipfile.zlib is zlib_ng:
+        yield
+        return
+    saved = zipfile.zlib, zipfile.crc32
+    zipfile.zlib, zipfile.crc32 = zlib_ng, zlib_ng.crc32
+    try:
+        yield
+    finally:
+        zipfile.zlib, zipfile.crc32 = saved
 
 SUPPORTED_BACKENDS = {"local", "s3", "webdav"}
 
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+ARCHIVE_WRITE_SLICE = 1024 * 1024
+DEFAULT_JSON_COMPRESSLEVEL = 1
+WEBDAV_SEND_BLOCKSIZE = 1024 * 1024
+
 
 class SyncConfigurationError(RuntimeError):
     """Raised when the sync backend is misconfigured."""
@@ -49,72 +89,274 @@ def _staging_dir(config: Dict[str, object]) -> Path:
     return get_storage_path(config, "root") / "cache" / "sync"
 
 
+@dataclass
+class _SyncPaths:
+    """Filesystem locations resolved once per sync run."""
+
+    entries: Path
+    staging: Path
+    backups: Path
+
+    @property
+    def manifest(self) -> Path:
+        return self.staging / "manifest.json"
+
+
+def _resolve_paths(config: Dict[str, object]) -> _SyncPaths:
+    sync_cfg = _sync_config(config)
+    local_cfg = sync_cfg.get("local", {}) if isinstance(sync_cfg, dict) else {}
+    return _SyncPaths(
+        entries=get_storage_path(config, "journal") / "entries.json",
+        staging=_staging_dir(config),
+        backups=Path(local_cfg.get("path") or (get_storage_path(config, "root") / "backups")),
+    )
+
+
 def _ensure_cipher(config: Dict[str, object], cipher, password: Optional[str]):
     if cipher:
         return cipher
     return get_cipher(config, password=password)
 
 
-def package_journal(
-    config: Dict[str, object] | None = None,
+ArchiveMembers = List[Tuple[str, bytes]]
+
+DEFAULT_FULL_SNAPSHOT_EVERY = 10
+
+
+@dataclass
+class _JournalDelta:
+    """Entries appended since the last snapshot a backend received."""
+
+    entries: List[object]
+    base_count: int
+    sequence: int
+
+
+@dataclass
+class _IncrementalPlan:
+    """What an incremental sync should send, plus the manifest state to record."""
+
+    payload: bytes
+    state: Dict[str, object]
+    delta: Optional[_JournalDelta] = None
+    unchanged: bool = False
+    record: bool = True
+
+
+def _entries_digest(entries: List[object]) -> str:
+    canonical = json.dumps(entries, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _load_manifest(paths: _SyncPaths) -> Dict[str, Dict[str, object]]:
+    try:
+        manifest = json.loads(paths.manifest.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _record_sync(paths: _SyncPaths, backend: str, state: Dict[str, object]) -> None:
+    manifest = _load_manifest(paths)
+    manifest[backend] = state
+    paths.manifest.parent.mkdir(parents=True, exist_ok=True)
+    paths.manifest.write_bytes(jsontools.dumps(manifest, indent=True))
+
+
+def _plan_incremental(paths: _SyncPaths, backend: str, *, full_every: int) -> _IncrementalPlan:
+    """Compare ``entries.json`` with what ``backend`` last received.
+
+    Unchanged journals are skipped outright.  When the previously synced
+    entries are still an exact prefix of the journal only the appended tail is
+    sent, with a full snapshot forced every ``full_every`` deltas so restores
+    never need a long chain.
+    """
+
+    if not paths.entries.exists():
+        paths.entries.parent.mkdir(parents=True, exist_ok=True)
+        paths.entries.write_text("[]", encoding="utf-8")
+    payload = paths.entries.read_bytes()
+    file_digest = hashlib.sha256(payload).hexdigest()
+    previous = _load_manifest(paths).get(backend) or {}
+    if previous.get("sha256") == file_digest:
+        return _IncrementalPlan(payload=payload, state=previous, unchanged=True, record=False)
+
+    try:
+        entries = json.loads(payload)
+    except ValueError:
+        entries = None
+    if not isinstance(entries, list):
+        # Not something we can slice; ship it verbatim as a snapshot.
+        return _IncrementalPlan(payload=payload, state={"sha256": file_digest})
+
+    state: Dict[str, object] = {
+        "sha256": file_digest,
+        "count": len(entries),
+        "digest": _entries_digest(entries),
+        "deltas": 0,
+    }
+    base_count = previous.get("count")
+    deltas = int(previous.get("deltas") or 0)
+    if (
+        isinstance(base_count, int)
+        and 0 < base_count <= len(entries)
+        and deltas < full_every
+        and _entries_digest(entries[:base_count]) == previous.get("digest")
+    ):
+        if base_count == len(entries):
+            # Only the formatting changed; remember the new bytes and move on.
+            state.update(deltas=deltas, archive=previous.get("archive"), remote=previous.get("remote"))
+            return _IncrementalPlan(payload=payload, state=state, unchanged=True)
+        state["deltas"] = deltas + 1
+        delta = _JournalDelta(entries=entries[base_count:], base_count=base_count, sequence=deltas + 1)
+        return _IncrementalPlan(payload=payload, state=state, delta=delta)
+    return _IncrementalPlan(payload=payload, state=state)
+
+
+def _stage_journal(
+    config: Dict[str, object],
     *,
+    paths: Optional[_SyncPaths] = None,
     cipher=None,
     password: Optional[str] = None,
     include_restore_point: bool = True,
     dry_run: bool = False,
-) -> Path:
-    """Package the journal into an encrypted zip archive.
+    plan: Optional[_IncrementalPlan] = None,
+) -> Tuple[Path, ArchiveMembers]:
+    """Resolve the staging archive path and build its members in memory.
 
-    The archive always contains an encrypted ``journal.enc`` payload and a
-    ``metadata.json`` descriptor.  When ``include_restore_point`` is true a
-    plain-text copy of the original ``entries.json`` is stored alongside so
-    that users can recover even if keys change.
+    With a ``plan`` carrying a delta, the archive holds only the appended
+    entries and is named ``journal-delta-<seq>-<timestamp>.zip``.
     """
 
-    config = config or load_config()
     sync_cfg = _sync_config(config)
-    entries_path = get_storage_path(config, "journal") / "entries.json"
+    paths = paths or _resolve_paths(config)
+    entries_path = paths.entries
     entries_path.parent.mkdir(parents=True, exist_ok=True)
     if not entries_path.exists():
         entries_path.write_text("[]", encoding="utf-8")
 
-    staging_root = _staging_dir(config)
+    staging_root = paths.staging
     staging_root.mkdir(parents=True, exist_ok=True)
-    archive_path = staging_root / f"journal-sync-{datetime.now().strftime('%Y%m%d-%H%M%S')}.zip"
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    delta = plan.delta if plan else None
+    if delta is not None:
+        archive_path = staging_root / f"journal-delta-{delta.sequence:04d}-{stamp}.zip"
+    else:
+        archive_path = staging_root / f"journal-sync-{stamp}.zip"
 
     if dry_run:
-        return archive_path
+        return archive_path, []
 
     cipher = _ensure_cipher(config, cipher, password)
-    payload = entries_path.read_bytes()
-    encrypted_payload = cipher.encrypt(payload)
-
+    payload = plan.payload if plan else entries_path.read_bytes()
+    restore_name = "entries.json"
     metadata = {
         "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
         "source": str(entries_path),
         "config_version": config.get("version", "2.0"),
         "backend": sync_cfg.get("backend", "local"),
+        "kind": "full",
     }
+    if delta is not None:
+        payload = jsontools.dumps(delta.entries, indent=True)
+        restore_name = "entries-delta.json"
+        metadata.update(kind="delta", sequence=delta.sequence, base_count=delta.base_count)
+    encrypted_payload = cipher.encrypt(payload)
+
+    members: ArchiveMembers = [
+        ("journal.enc", encrypted_payload),
+        ("metadata.json", jsontools.dumps(metadata, indent=True)),
+    ]
+    if include_restore_point:
+        members.append((restore_name, payload))
+        members.append(("config.json", jsontools.dumps(config, indent=True)))
+    return archive_path, members
+
+
+def _json_compresslevel(config: Dict[str, object]) -> int:
+    level = _sync_config(config).get("compresslevel")
+    return DEFAULT_JSON_COMPRESSLEVEL if level is None else int(level)
+
+
+def _set_compresslevel(info: ZipInfo, level: int) -> None:
+    # Python 3.13 made the per-member level public as ``compress_level``.
+    if hasattr(info, "compress_level"):
+        info.compress_level = level
+    else:
+        info._compresslevel = level
+
+
+def _write_archive(fileobj, members: ArchiveMembers, *, json_level: int = DEFAULT_JSON_COMPRESSLEVEL) -> None:
+    """Write ``members`` as a deflated zip into ``fileobj``.
+
+    Member data is fed to the compressor in slices so that streaming
+    consumers see output while large members are still being compressed.
+    JSON members are plain text that deflates well even at ``json_level``
+    (1 by default), which is several times faster than zlib's level 6.
+    """
+
+    with _zlib_ng_codecs(), ZipFile(fileobj, mode="w", compression=ZIP_DEFLATED) as archive:
+        for name, data in members:
+            info = ZipInfo(name, date_time=time.localtime(time.time())[:6])
+            info.compress_type = ZIP_DEFLATED
+            info.external_attr = 0o600 << 16
+            info.file_size = len(data)
+            if name.endswith(".json"):
+                _set_compresslevel(info, json_level)
+            view = memoryview(data)
+            with archive.open(info, mode="w") as dest:
+                for offset in range(0, len(view), ARCHIVE_WRITE_SLICE):
+                    dest.write(view[offset : offset + ARCHIVE_WRITE_SLICE])
+
 
-    with ZipFile(archive_path, mode="w", compression=ZIP_DEFLATED) as archive:
-        archive.writestr("journal.enc", encrypted_payload)
-        archive.writestr("metadata.json", json.dumps(metadata, indent=2))
-        if include_restore_point:
-            archive.writestr("entries.json", entries_path.read_text(encoding="utf-8"))
-            archive.writestr("config.json", json.dumps(config, indent=2))
+def package_journal(
+    config: Dict[str, object] | None = None,
+    *,
+    cipher=None,
+    password: Optional[str] = None,
+    include_restore_point: bool = True,
+    dry_run: bool = False,
+) -> Path:
+    """Package the journal into an encrypted zip archive.
+
+    The archive always contains an encrypted ``journal.enc`` payload and a
+    ``metadata.json`` descriptor.  When ``include_restore_point`` is true a
+    plain-text copy of the original ``entries.json`` is stored alongside so
+    that users can recover even if keys change.
+    """
+
+    config = config or load_config()
+    archive_path, members = _stage_journal(
+        config,
+        cipher=cipher,
+        password=password,
+        include_restore_point=include_restore_point,
+        dry_run=dry_run,
+    )
+    if dry_run:
+        return archive_path
+
+    with archive_path.open("wb") as handle:
+        _write_archive(handle, members, json_level=_json_compresslevel(config))
     return archive_path
 
 
-def _local_destination(config: Dict[str, object], archive: Path) -> Path:
-    sync_cfg = _sync_config(config)
-    local_cfg = sync_cfg.get("local", {}) if isinstance(sync_cfg, dict) else {}
-    target_dir = Path(local_cfg.get("path") or (get_storage_path(config, "root") / "backups"))
+def _local_destination(config: Dict[str, object], archive: Path, *, paths: Optional[_SyncPaths] = None) -> Path:
+    target_dir = (paths or _resolve_paths(config)).backups
     target_dir.mkdir(parents=True, exist_ok=True)
     return target_dir / archive.name
 
 
-def _sync_local(config: Dict[str, object], archive: Path, *, allow_overwrite: bool, dry_run: bool) -> SyncResult:
-    destination = _local_destination(config, archive)
+def _sync_local(
+    config: Dict[str, object],
+    archive: Path,
+    *,
+    allow_overwrite: bool,
+    dry_run: bool,
+    paths: Optional[_SyncPaths] = None,
+) -> SyncResult:
+    destination = _local_destination(config, archive, paths=paths)
     if destination.exists() and not allow_overwrite:
         raise SyncConflictError(destination)
     if dry_run:
@@ -123,7 +365,181 @@ def _sync_local(config: Dict[str, object], archive: Path, *, allow_overwrite: bo
     return SyncResult(archive=destination, backend="local")
 
 
-def _sync_s3(config: Dict[str, object], archive: Path, *, allow_overwrite: bool, dry_run: bool) -> SyncResult:
+def _s3_multipart_threshold(s3_cfg: Dict[str, object]) -> int:
+    return int(s3_cfg.get("multipart_threshold") or S3_MULTIPART_CHUNKSIZE)
+
+
+class _UploadStopped(Exception):
+    """Raised inside the producer once the consumer gave up on the upload."""
+
+
+class _PartWriter:
+    """Write-only stream that tees zip output to disk and queues upload parts."""
+
+    def __init__(
+        self,
+        handle,
+        parts: "queue.Queue[Optional[bytes]]",
+        part_size: int,
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        self._handle = handle
+        self._parts = parts
+        self._part_size = part_size
+        self._stop = stop
+        self._buffer = io.BytesIO()
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._handle.write(data)
+        self._buffer.write(data)
+        self._position += len(data)
+        if self._buffer.tell() >= self._part_size:
+            self._emit()
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        self._handle.flush()
+
+    def finish(self) -> None:
+        if self._buffer.tell():
+            self._emit()
+
+    def _emit(self) -> None:
+        if self._stop is not None and self._stop.is_set():
+            raise _UploadStopped()
+        self._parts.put(self._buffer.getvalue())
+        self._buffer = io.BytesIO()
+
+
+def _produce_parts(
+    archive: Path,
+    members: ArchiveMembers,
+    parts: "queue.Queue[Optional[bytes]]",
+    errors: List[BaseException],
+    json_level: int,
+    stop: Optional[threading.Event] = None,
+) -> None:
+    try:
+        with archive.open("wb") as handle:
+            writer = _PartWriter(handle, parts, S3_MULTIPART_CHUNKSIZE, stop)
+            _write_archive(writer, members, json_level=json_level)
+            writer.finish()
+    except BaseException as exc:  # noqa: BLE001 - re-raised by the consumer
+        errors.append(exc)
+    finally:
+        parts.put(None)
+
+
+def _upload_s3_pipelined(
+    client,
+    bucket: str,
+    key: str,
+    archive: Path,
+    members: ArchiveMembers,
+    *,
+    max_workers: int,
+    json_level: int = DEFAULT_JSON_COMPRESSLEVEL,
+    condition: Optional[Dict[str, str]] = None,
+) -> None:
+    """Zip ``members`` and upload the archive as it is produced.
+
+    A background thread writes the staging archive while handing fixed-size
+    parts to a thread pool that uploads them as one S3 multipart upload, so
+    wall-clock time approaches the slower of packaging and network instead of
+    their sum.  ``condition`` is forwarded to ``complete_multipart_upload``.
+    The first failed part stops packaging and aborts the upload without
+    waiting for the remaining parts.
+    """
+
+    parts: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max_workers)
+    in_flight = threading.BoundedSemaphore(max_workers * 2)
+    errors: List[BaseException] = []
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_produce_parts,
+        args=(archive, members, parts, errors, json_level, stop),
+        daemon=True,
+    )
+
+    def _part_done(future) -> None:
+        in_flight.release()
+        if not future.cancelled() and future.exception() is not None:
+            stop.set()
+
+    upload_id = client.create_multipart_upload(Bucket=bucket, Key=key)["UploadId"]
+    producer.start()
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    futures = []
+    try:
+        while True:
+            chunk = parts.get()
+            if chunk is None or stop.is_set():
+                break
+            if errors:
+                # Keep draining after a packaging failure so the producer never blocks.
+                continue
+            in_flight.acquire()
+            if stop.is_set():
+                break
+            future = pool.submit(
+                client.upload_part,
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=len(futures) + 1,
+                Body=chunk,
+            )
+            future.add_done_callback(_part_done)
+            futures.append(future)
+        if stop.is_set():
+            raise next(f.exception() for f in futures if f.done() and not f.cancelled() and f.exception())
+        pool.shutdown()
+        producer.join()
+        if errors:
+            raise errors[0]
+        completed = [
+            {"ETag": future.result()["ETag"], "PartNumber": number} for number, future in enumerate(futures, start=1)
+        ]
+        client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": completed},
+            **(condition or {}),
+        )
+    except BaseException:
+        stop.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+        client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        # Unblock the producer; it stops at its next part.
+        while producer.is_alive() or not parts.empty():
+            try:
+                if parts.get(timeout=0.1) is None:
+                    break
+            except queue.Empty:
+                continue
+        raise
+
+
+def _is_s3_precondition_failure(exc: Exception) -> bool:
+    response = getattr(exc, "response", None) or {}
+    code = response.get("Error", {}).get("Code")
+    status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return code in {"PreconditionFailed", "ConditionalRequestConflict"} or status == 412
+
+
+def _sync_s3(
+    config: Dict[str, object],
+    archive: Path,
+    *,
+    allow_overwrite: bool,
+    dry_run: bool,
+    members: Optional[ArchiveMembers] = None,
+) -> SyncResult:
     sync_cfg = _sync_config(config)
     s3_cfg = sync_cfg.get("s3", {}) if isinstance(sync_cfg, dict) else {}
     if not s3_cfg.get("enabled"):
@@ -139,6 +555,7 @@ def _sync_s3(config: Dict[str, object], archive: Path, *, allow_overwrite: bool,
 
     try:
         import boto3
+        from boto3.s3.transfer import TransferConfig
     except Exception as exc:  # noqa: BLE001
         raise SyncConfigurationError("boto3 is required for S3 sync") from exc
 
@@ -151,19 +568,65 @@ def _sync_s3(config: Dict[str, object], archive: Path, *, allow_overwrite: bool,
         endpoint_url=s3_cfg.get("endpoint") or None,
         region_name=s3_cfg.get("region") or None,
     )
-    if not allow_overwrite:
-        try:
-            client.head_object(Bucket=bucket, Key=key)
-            raise SyncConflictError(remote)
-        except client.exceptions.NoSuchKey:
-            pass
-        except client.exceptions.ClientError:
-            # Treat unknown errors as missing to avoid false positives offline
-            pass
-    client.upload_file(str(archive), bucket, key)
+    # S3 enforces "do not overwrite" atomically via If-None-Match, which
+    # saves the HEAD round trip and closes the check-then-upload race.
+    condition = {} if allow_overwrite else {"IfNoneMatch": "*"}
+    max_concurrency = int(s3_cfg.get("max_concurrency") or 10)
+    try:
+        if members is not None:
+            _upload_s3_pipelined(
+                client,
+                bucket,
+                key,
+                archive,
+                members,
+                max_workers=max_concurrency,
+                json_level=_json_compresslevel(config),
+                condition=condition,
+            )
+        elif condition:
+            # upload_file cannot send conditional headers; archives that
+            # reach this branch are below the multipart threshold anyway.
+            with archive.open("rb") as body:
+                client.put_object(Bucket=bucket, Key=key, Body=body, **condition)
+        else:
+            # Large archives are split into parts that upload concurrently,
+            # which matters far more than CPU on high-latency links.
+            transfer_cfg = TransferConfig(
+                multipart_threshold=_s3_multipart_threshold(s3_cfg),
+                multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+                max_concurrency=max_concurrency,
+                use_threads=True,
+            )
+            client.upload_file(str(archive), bucket, key, Config=transfer_cfg)
+    except client.exceptions.ClientError as exc:
+        if _is_s3_precondition_failure(exc):
+            raise SyncConflictError(remote) from exc
+        raise
     return SyncResult(archive=archive, backend="s3", remote_target=remote)
 
 
+def _webdav_opener():
+    """Return a urllib opener that sends request bodies in large blocks.
+
+    ``http.client`` streams file bodies in 8 KiB writes by default; raising
+    the block size cuts the syscall count for big archives.  The change is
+    scoped to this opener rather than patched into ``HTTPConnection``.
+    """
+
+    from functools import partial
+    from urllib import request
+
+    class _BlockSizeMixin:
+        def do_open(self, http_class, req, **kwargs):
+            return super().do_open(partial(http_class, blocksize=WEBDAV_SEND_BLOCKSIZE), req, **kwargs)
+
+    handlers = [type("_BulkHTTPHandler", (_BlockSizeMixin, request.HTTPHandler), {})]
+    if hasattr(request, "HTTPSHandler"):
+        handlers.append(type("_BulkHTTPSHandler", (_BlockSizeMixin, request.HTTPSHandler), {}))
+    return request.build_opener(*handlers)
+
+
 def _sync_webdav(config: Dict[str, object], archive: Path, *, allow_overwrite: bool, dry_run: bool) -> SyncResult:
     sync_cfg = _sync_config(config)
     webdav_cfg = sync_cfg.get("webdav", {}) if isinstance(sync_cfg, dict) else {}
@@ -179,13 +642,13 @@ def _sync_webdav(config: Dict[str, object], archive: Path, *, allow_overwrite: b
 
     from urllib import error, request
 
-    req = request.Request(remote, data=archive.read_bytes(), method="PUT")
+    headers = {}
     if webdav_cfg.get("username"):
         credentials = f"{webdav_cfg.get('username')}:{webdav_cfg.get('password', '')}"
         token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
-        req.add_header("Authorization", f"Basic {token}")
+        headers["Authorization"] = f"Basic {token}"
 
-    opener = request.build_opener()
+    opener = _webdav_opener()
     if not allow_overwrite:
         head_req = request.Request(remote, method="HEAD")
         try:
@@ -194,7 +657,13 @@ def _sync_webdav(config: Dict[str, object], archive: Path, *, allow_overwrite: b
         except error.HTTPError as exc:  # noqa: PERF203
             if exc.code not in {401, 404}:
                 raise
-    opener.open(req)
+
+    # Hand urllib the open file with an explicit length so the body is
+    # streamed from disk instead of being loaded into memory first.
+    headers["Content-Length"] = str(archive.stat().st_size)
+    with archive.open("rb") as handle:
+        req = request.Request(remote, data=handle, headers=headers, method="PUT")
+        opener.open(req).close()
     return SyncResult(archive=archive, backend="webdav", remote_target=remote)
 
 
@@ -207,8 +676,14 @@ def perform_sync(
     include_restore_point: bool = True,
     allow_overwrite: bool = False,
     dry_run: bool = False,
+    incremental: Optional[bool] = None,
 ) -> SyncResult:
-    """Package the journal and send it to the selected backend."""
+    """Package the journal and send it to the selected backend.
+
+    When ``incremental`` (or ``sync.incremental``) is enabled, unchanged
+    journals are not re-sent and appended entries travel as small delta
+    archives between periodic full snapshots.
+    """
 
     config = config or load_config()
     sync_cfg = _sync_config(config)
@@ -219,23 +694,79 @@ def perform_sync(
     include_restore_point = bool(include_restore_point and sync_cfg.get("restore_point", True))
     dry_run = bool(dry_run or sync_cfg.get("dry_run", False))
 
-    archive = package_journal(
+    if incremental is None:
+        incremental = bool(sync_cfg.get("incremental", False))
+
+    paths = _resolve_paths(config)
+    plan = None
+    if incremental and not dry_run:
+        full_every = int(sync_cfg.get("full_every") or DEFAULT_FULL_SNAPSHOT_EVERY)
+        plan = _plan_incremental(paths, backend, full_every=full_every)
+        if plan.unchanged:
+            if plan.record:
+                _record_sync(paths, backend, plan.state)
+            last_archive = plan.state.get("archive")
+            return SyncResult(
+                archive=Path(last_archive) if last_archive else paths.entries,
+                backend=backend,
+                remote_target=plan.state.get("remote"),
+                unchanged=True,
+            )
+
+    archive, members = _stage_journal(
         config,
+        paths=paths,
         cipher=cipher,
         password=password,
         include_restore_point=include_restore_point,
         dry_run=dry_run,
+        plan=plan,
     )
 
     if dry_run:
         return SyncResult(archive=archive, backend=backend, dry_run=True)
 
+    result = _send_archive(
+        config,
+        backend,
+        archive,
+        members,
+        paths=paths,
+        allow_overwrite=allow_overwrite,
+    )
+    if plan is not None:
+        plan.state.update(archive=str(result.archive), remote=result.remote_target)
+        _record_sync(paths, backend, plan.state)
+    return result
+
+
+def _send_archive(
+    config: Dict[str, object],
+    backend: str,
+    archive: Path,
+    members: ArchiveMembers,
+    *,
+    paths: _SyncPaths,
+    allow_overwrite: bool,
+) -> SyncResult:
+    sync_cfg = _sync_config(config)
+
+    if backend == "s3":
+        # Archives big enough for a multipart upload are zipped and sent in
+        # one overlapped pass; small ones keep the single PUT.
+        s3_cfg = sync_cfg.get("s3", {}) if isinstance(sync_cfg, dict) else {}
+        if sum(len(data) for _name, data in members) >= _s3_multipart_threshold(s3_cfg):
+            return _sync_s3(config, archive, allow_overwrite=allow_overwrite, dry_run=False, members=members)
+
+    with archive.open("wb") as handle:
+        _write_archive(handle, members, json_level=_json_compresslevel(config))
+
     if backend == "local":
-        return _sync_local(config, archive, allow_overwrite=allow_overwrite, dry_run=dry_run)
+        return _sync_local(config, archive, allow_overwrite=allow_overwrite, dry_run=False, paths=paths)
     if backend == "s3":
-        return _sync_s3(config, archive, allow_overwrite=allow_overwrite, dry_run=dry_run)
+        return _sync_s3(config, archive, allow_overwrite=allow_overwrite, dry_run=False)
     if backend == "webdav":
-        return _sync_webdav(config, archive, allow_overwrite=allow_overwrite, dry_run=dry_run)
+        return _sync_webdav(config, archive, allow_overwrite=allow_overwrite, dry_run=False)
 
     raise SyncConfigurationError(f"Unhandled backend: {backend}")
 
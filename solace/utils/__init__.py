@@ -1,6 +1,20 @@
 from .storage import *
-from .voice import VoiceEngine, speak as speak_text, recognize_speech
 
 VOICE_AVAILABLE = True
 
-speak = speak_text
+# The voice stack pulls in numpy and the audio drivers, so it is only imported
+# when one of these names is first used rather than by every solace.utils import.
+_VOICE_EXPORTS = {
+    "VoiceEngine": "VoiceEngine",
+    "speak_text": "speak",
+    "speak": "speak",
+    "recognize_speech": "recognize_speech",
+}
+
+
+def __getattr__(name):
+    if name in _VOICE_EXPORTS:
+        from . import voice
+
+        return getattr(voice, _VOICE_EXPORTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
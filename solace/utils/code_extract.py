@@ -13,9 +13,10 @@ def extract_code_blocks(text: str) -> List[str]:
     blocks: List[str] = []
     inside = False
     current: List[str] = []
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("```"):
+    lines = text.splitlines()
+    for line in lines:
+        # Cheap containment test rejects most lines before any stripping.
+        if "`" in line and line.lstrip().startswith("```"):
             if inside:
                 if current:
                     blocks.append("\n".join(current).rstrip())
@@ -31,8 +32,8 @@ def extract_code_blocks(text: str) -> List[str]:
 
     if not blocks:
         group: List[str] = []
-        for line in text.splitlines():
-            if line.startswith("    "):
+        for line in lines:
+            if line[:4] == "    ":
                 group.append(line[4:])
             elif group:
                 blocks.append("\n".join(group).rstrip())
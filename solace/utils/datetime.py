@@ -1,11 +1,24 @@
+import re
 from datetime import datetime
 from typing import Tuple
 
 FMT = "%Y-%m-%d %H:%M"
+# The per-directive patterns ``strptime(value, FMT)`` builds (``\d`` is any
+# Unicode digit and the space matches any run of whitespace), compiled once
+# instead of re-parsing the format string on every call.
+_TS_RE = re.compile(
+    r"(\d\d\d\d)-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+    r"\s+(2[0-3]|[0-1]\d|\d):([0-5]\d|\d)"
+)
+_FILENAME_TABLE = str.maketrans({":": "-", " ": "_"})
 
 
 def parse_timestamp(value: str) -> datetime:
-    return datetime.strptime(value, FMT)
+    match = _TS_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"time data {value!r} does not match format {FMT!r}")
+    year, month, day, hour, minute = map(int, match.groups())
+    return datetime(year, month, day, hour, minute)
 
 
 def format_timestamp(dt: datetime) -> str:
@@ -32,4 +45,4 @@ def prompt_timestamp() -> str:
 
 
 def ts_to_filename(ts: str) -> str:
-    return ts.replace(":", "-").replace(" ", "_")
+    return ts.translate(_FILENAME_TABLE)
@@ -0,0 +1,32 @@
+"""JSON encoding shared by storage, sync, the trainer and the web API.
+
+orjson is used when installed; the stdlib fallback produces equivalent JSON.
+"""
+
+import json
+
+try:
+    import orjson
+except Exception:  # noqa: BLE001 - optional speedup
+    orjson = None
+
+
+def loads(raw):
+    """Parse JSON from ``bytes`` or ``str``; raises ``json.JSONDecodeError``."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps(data, *, indent: bool = False) -> bytes:
+    """Encode ``data`` as UTF-8 JSON, compact or with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dumps_line(data) -> bytes:
+    """Encode ``data`` compactly followed by a newline, for JSON Lines files."""
+    return dumps(data) + b'\n'
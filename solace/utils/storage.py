@@ -1,7 +1,10 @@
 import json
+import os
 from pathlib import Path
 from typing import Iterable
 
+from . import jsontools
+
 DATA_DIR = Path(__file__).resolve().parents[1] / 'data'
 
 ENTRY_FILE = DATA_DIR / 'entries.json'
@@ -12,36 +15,129 @@ STORAGE_DIR = Path(__file__).resolve().parents[2] / 'storage'
 DIARY_DIR = STORAGE_DIR / 'diary'
 KNOWLEDGE_DIR = STORAGE_DIR / 'knowledge'
 TAGS_INDEX_FILE = STORAGE_DIR / 'tags_index.json'
+TAGS_INDEX_LOG = TAGS_INDEX_FILE.with_suffix('.log')
+TAGS_LOG_COMPACT_EVERY = 500
+
+_tags_index = None
+_tags_log_records = 0
 
 
 def load_json(path, default):
     if not path.exists():
         return default
-    with path.open('r', encoding='utf-8') as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError:
-            return default
+    try:
+        return jsontools.loads(path.read_bytes())
+    except json.JSONDecodeError:
+        return default
 
 
 def save_json(path, data):
+    """Serialise ``data`` once and atomically replace ``path`` with it."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open('w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        tmp.write_bytes(jsontools.dumps(data, indent=True))
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _add_tag_file(index, tag: str, file_name: str) -> bool:
+    files = index.setdefault(tag, set())
+    if file_name in files:
+        return False
+    files.add(file_name)
+    return True
+
+
+def load_tags_index():
+    """Return the tag index, replaying appended updates on first use.
+
+    The index maps each tag to a set of file paths and lives in memory for
+    the rest of the process.  Updates are appended to ``TAGS_INDEX_LOG`` and
+    folded into ``TAGS_INDEX_FILE`` by :func:`compact_tags_index`.
+    """
+    global _tags_index, _tags_log_records
+    if _tags_index is None:
+        index = {tag: set(files) for tag, files in load_json(TAGS_INDEX_FILE, {}).items()}
+        records = _replay_tags_log(index, TAGS_INDEX_LOG) if TAGS_INDEX_LOG.exists() else 0
+        _tags_index = index
+        _tags_log_records = records
+    return _tags_index
+
+
+def _replay_tags_log(index, path: Path) -> int:
+    records = 0
+    for line in path.read_bytes().splitlines():
+        try:
+            record = jsontools.loads(line)
+        except json.JSONDecodeError:
+            continue  # torn write from an interrupted append
+        _add_tag_file(index, record['tag'], record['file'])
+        records += 1
+    return records
+
+
+def compact_tags_index() -> None:
+    """Write the full tag index to disk and truncate the update log.
+
+    The log is moved aside first, so records other processes append while
+    compacting land in a fresh log; whatever they wrote before is read back
+    from disk and folded in rather than overwritten by this process's view.
+    """
+    global _tags_log_records
+    index = load_tags_index()
+    pending = TAGS_INDEX_LOG.with_name(f'.{TAGS_INDEX_LOG.name}.{os.getpid()}.compact')
+    try:
+        os.replace(TAGS_INDEX_LOG, pending)
+    except FileNotFoundError:
+        pending = None
+    try:
+        for tag, files in load_json(TAGS_INDEX_FILE, {}).items():
+            for file_name in files:
+                _add_tag_file(index, tag, file_name)
+        if pending is not None:
+            _replay_tags_log(index, pending)
+        save_json(TAGS_INDEX_FILE, {tag: sorted(files) for tag, files in index.items()})
+    except BaseException:
+        if pending is not None:
+            # Hand the set-aside records back to the live log.
+            data = pending.read_bytes()
+            with TAGS_INDEX_LOG.open('ab') as f:
+                f.write(data if data.endswith(b'\n') else data + b'\n')
+            pending.unlink()
+        raise
+    if pending is not None:
+        pending.unlink()
+    _tags_log_records = 0
 
 
 def update_tags_index(tags: Iterable[str], file_path: Path) -> None:
     """Add ``file_path`` to the tag index for each tag in ``tags``."""
+    global _tags_log_records
     tags = list(tags)
     if not tags:
         return
-    index = load_json(TAGS_INDEX_FILE, {})
-    for tag in tags:
-        files = index.get(tag, [])
-        if str(file_path) not in files:
-            files.append(str(file_path))
-        index[tag] = files
-    save_json(TAGS_INDEX_FILE, index)
+    index = load_tags_index()
+    file_name = str(file_path)
+    added = [
+        {'tag': tag, 'file': file_name}
+        for tag in tags
+        if _add_tag_file(index, tag, file_name)
+    ]
+    if not added:
+        return
+    TAGS_INDEX_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with TAGS_INDEX_LOG.open('a+b') as f:
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(size - 1)
+            if f.read(1) != b'\n':
+                f.write(b'\n')  # start a fresh line after a torn append
+        f.write(b''.join(jsontools.dumps_line(record) for record in added))
+    _tags_log_records += len(added)
+    if _tags_log_records >= TAGS_LOG_COMPACT_EVERY:
+        compact_tags_index()
 
 
 # high level helpers
@@ -1,5 +1,9 @@
+import atexit
 import platform
 import importlib
+import queue
+import threading
+import time
 
 VOICE_RECOGNITION_AVAILABLE = True
 
@@ -15,6 +19,11 @@ except Exception:  # noqa: PIE786
     sd = None
     VOICE_RECOGNITION_AVAILABLE = False
 
+try:
+    np = importlib.import_module('numpy')
+except Exception:  # noqa: PIE786
+    np = None
+
 try:
     sr = importlib.import_module('speech_recognition')
 except Exception:  # noqa: PIE786
@@ -60,6 +69,19 @@ from ..settings_manager import SETTINGS
 
 _engine = None
 
+SAMPLE_RATE = 16000
+MAX_RECORD_SECONDS = 30
+# 20 ms capture blocks; the end-of-speech detector works on one block at a time.
+BLOCK_FRAMES = 320
+# RMS level (int16 scale) above which a block counts as speech.
+SPEECH_RMS_THRESHOLD = 500
+# Trailing silence after speech that ends the capture (~300 ms).
+SILENCE_BLOCKS = 15
+
+# Reused capture buffer so each utterance does not allocate a fresh block;
+# created on the first capture so importers without STT do not pay for it.
+_REC_BUF = None
+
 
 def _get_engine():
     global _engine
@@ -71,19 +93,74 @@ def _get_engine():
     return _engine
 
 
-def _speak_text(text: str) -> None:
-    """Speak the given text using pyttsx3 if available."""
+# How long queued speech may keep the interpreter alive at exit.
+TTS_EXIT_TIMEOUT = 5.0
+
+_tts_queue: "queue.Queue[str]" = queue.Queue()
+_tts_thread = None
+_tts_lock = threading.Lock()
+
+
+def _tts_worker() -> None:
+    # The engine is created and used only on this thread; some pyttsx3
+    # drivers (SAPI5) misbehave when called from more than one thread.
+    while True:
+        text = _tts_queue.get()
+        try:
+            engine = _get_engine()
+            engine.say(text)
+            engine.runAndWait()
+        except Exception:  # noqa: BLE001
+            print("Unable to speak. Please check TTS dependencies.")
+        finally:
+            _tts_queue.task_done()
+
+
+def _ensure_tts_thread() -> None:
+    global _tts_thread
+    with _tts_lock:
+        if _tts_thread is None:
+            _tts_thread = threading.Thread(target=_tts_worker, name="solace-tts", daemon=True)
+            _tts_thread.start()
+            atexit.register(_finish_tts)
+
+
+def _drain_tts_queue() -> None:
+    while True:
+        try:
+            _tts_queue.get_nowait()
+        except queue.Empty:
+            return
+        _tts_queue.task_done()
+
+
+def _finish_tts() -> None:
+    """Let queued speech finish at exit, but never wait past the deadline.
+
+    A hung driver or a long backlog must not keep the interpreter alive;
+    whatever is still pending afterwards is dropped with the daemon thread.
+    """
+    deadline = time.monotonic() + TTS_EXIT_TIMEOUT
+    while _tts_queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
+    _drain_tts_queue()
+
+
+def _speak_text(text: str, *, barge_in: bool = False) -> None:
+    """Queue ``text`` for speech with pyttsx3 if available.
+
+    Speech runs on a background thread so the caller is not blocked for the
+    length of the utterance.  ``barge_in`` drops anything not yet spoken.
+    """
     if not SETTINGS.get("enable_tts", True):
         return
     if pyttsx3 is None:
         print("pyttsx3 is missing. Install voice packages with /install voice.")
         return
-    try:
-        engine = _get_engine()
-        engine.say(text)
-        engine.runAndWait()
-    except Exception:  # noqa: BLE001
-        print("Unable to speak. Please check TTS dependencies.")
+    if barge_in:
+        _drain_tts_queue()
+    _ensure_tts_thread()
+    _tts_queue.put(text)
 
 
 # backward compatibility
@@ -108,6 +185,60 @@ class VoiceEngine:
 speak = _speak_text
 
 
+def _recording_buffer(frames: int):
+    """Return an ``int16`` view of ``frames`` samples from the shared buffer."""
+    global _REC_BUF
+    if _REC_BUF is None or len(_REC_BUF) < frames:
+        _REC_BUF = np.empty((max(frames, MAX_RECORD_SECONDS * SAMPLE_RATE), 1), dtype=np.int16)
+    return _REC_BUF[:frames]
+
+
+class _SpeechCapture:
+    """Fill a slice of the shared buffer from an input stream callback.
+
+    Capture stops once ``SILENCE_BLOCKS`` quiet blocks follow speech or the
+    buffer is full, whichever comes first.
+    """
+
+    def __init__(self, buf) -> None:
+        self.buf = buf
+        self.filled = 0
+        self.heard_speech = False
+        self.silent_blocks = 0
+        self.done = threading.Event()
+
+    def callback(self, indata, frames, _time, _status) -> None:
+        if self.done.is_set():
+            return
+        count = min(frames, len(self.buf) - self.filled)
+        self.buf[self.filled:self.filled + count] = indata[:count]
+        self.filled += count
+        block = indata[:count].astype(np.float32)
+        rms = float(np.sqrt(np.mean(block * block))) if count else 0.0
+        if rms >= SPEECH_RMS_THRESHOLD:
+            self.heard_speech = True
+            self.silent_blocks = 0
+        elif self.heard_speech:
+            self.silent_blocks += 1
+        if self.filled >= len(self.buf) or self.silent_blocks >= SILENCE_BLOCKS:
+            self.done.set()
+
+
+def _capture_utterance(duration: float):
+    """Record up to ``duration`` seconds, returning early after the speaker stops."""
+    capture = _SpeechCapture(_recording_buffer(int(duration * SAMPLE_RATE)))
+    with sd.InputStream(
+        samplerate=SAMPLE_RATE,
+        blocksize=BLOCK_FRAMES,
+        channels=1,
+        dtype='int16',
+        latency='low',
+        callback=capture.callback,
+    ):
+        capture.done.wait(timeout=duration + 0.5)
+    return capture.buf[:capture.filled]
+
+
 def recognize_speech(duration: int = 5) -> str | None:
     """Listen from microphone and return recognized text using PocketSphinx."""
     if not SETTINGS.get("enable_stt", False) or not VOICE_RECOGNITION_AVAILABLE:
@@ -116,13 +247,10 @@ def recognize_speech(duration: int = 5) -> str | None:
     if sd is None or sr is None:
         print("Missing speech packages. Install with /install voice.")
         return None
-    samplerate = 16000
     try:
-        recording = sd.rec(int(duration * samplerate), samplerate=samplerate,
-                           channels=1, dtype='int16')
-        sd.wait()
+        buf = _capture_utterance(duration)
         recognizer = sr.Recognizer()
-        audio_data = sr.AudioData(recording.tobytes(), samplerate, 2)
+        audio_data = sr.AudioData(bytes(memoryview(buf).cast('B')), SAMPLE_RATE, 2)
         return recognizer.recognize_sphinx(audio_data)
     except sr.UnknownValueError:
         return ''
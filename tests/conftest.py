@@ -5,6 +5,10 @@ from pathlib import Path
 
 import pytest
 
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
 
 @pytest.fixture
 def temp_home(monkeypatch, tmp_path):
@@ -15,14 +19,11 @@ def temp_home(monkeypatch, tmp_path):
 
 @pytest.fixture
 def reload_modules(temp_home):
-    project_root = Path(__file__).resolve().parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-
     module_names = [
         "solace.configuration",
         "journal",
         "solace.memory",
+        "solace.sync",
     ]
     for name in module_names:
         sys.modules.pop(name, None)
@@ -38,16 +39,12 @@ def reload_modules(temp_home):
 
 @pytest.fixture
 def main_module(temp_home, reload_modules):
-    project_root = Path(__file__).resolve().parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
-
     sys.modules.pop("main", None)
     sys.modules.pop("tui", None)
     sys.modules.pop("tui.app", None)
 
     dummy_package = types.ModuleType("tui")
-    dummy_package.__path__ = [str(project_root / "tui")]
+    dummy_package.__path__ = [str(_PROJECT_ROOT / "tui")]
     sys.modules["tui"] = dummy_package
 
     dummy_app = types.ModuleType("tui.app")
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+import pytest
+
+from solace.utils.datetime import FMT, parse_timestamp
+
+
+def _strptime_or_error(value):
+    try:
+        return datetime.strptime(value, FMT)
+    except ValueError:
+        return ValueError
+
+
+def _parse_or_error(value):
+    try:
+        return parse_timestamp(value)
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-01-02 09:05",
+        "2024-1-2 9:5",
+        "2024-01- 2 09:05",
+        "2024-01-02  09:05",
+        "2024-01-02\t09:05",
+        "2024-01-02\n09:05",
+        "٢٠٢٤-٠١-٠٢ ٠٩:٠٥",
+        "2024-12-31 23:59",
+        "2024-02-29 00:00",
+        "2023-02-29 00:00",
+        "2024-13-01 10:00",
+        "2024-00-01 10:00",
+        "2024-01-32 10:00",
+        "2024-01-02 24:00",
+        "2024-01-02 09:60",
+        "2024-01-0209:05",
+        " 2024-01-02 09:05",
+        "2024-01-02 09:05 ",
+        "24-01-02 09:05",
+        "2024/01/02 09:05",
+        "",
+    ],
+)
+def test_parse_timestamp_matches_strptime(value):
+    assert _parse_or_error(value) == _strptime_or_error(value)
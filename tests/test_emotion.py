@@ -0,0 +1,36 @@
+import pytest
+
+from solace.logic.emotion import MOOD_KEYWORDS, detect_mood
+
+
+def _detect_mood_by_substring(text: str) -> str:
+    # The original per-keyword loop the combined pattern replaced.
+    lower = text.lower()
+    for mood, words in MOOD_KEYWORDS.items():
+        for word in words:
+            if word in lower:
+                return mood
+    return "neutral"
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", "neutral"),
+        ("Nothing much today", "neutral"),
+        ("I am so HAPPY", "happy"),
+        ("Feeling unhappy", "happy"),
+        ("A bad day but a great dinner", "happy"),
+        ("I was mad, then worried", "angry"),
+        ("Nervous and sad", "sad"),
+        ("Scared, annoyed, depressed", "sad"),
+        ("madness", "angry"),
+        ("Going downtown", "sad"),
+        ("Enjoyable", "happy"),
+        ("ſad", "neutral"),
+        ("worried", "anxious"),
+    ],
+)
+def test_detect_mood_matches_keyword_loop(text, expected):
+    assert detect_mood(text) == expected
+    assert _detect_mood_by_substring(text) == expected
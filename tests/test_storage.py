@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from solace.utils import storage
+
+
+@pytest.fixture
+def tags_storage(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage, "TAGS_INDEX_FILE", tmp_path / "tags_index.json")
+    monkeypatch.setattr(storage, "TAGS_INDEX_LOG", tmp_path / "tags_index.log")
+    monkeypatch.setattr(storage, "_tags_index", None)
+    monkeypatch.setattr(storage, "_tags_log_records", 0)
+    return storage
+
+
+def _reset(storage):
+    storage._tags_index = None
+    storage._tags_log_records = 0
+
+
+def test_tag_updates_are_appended_and_replayed(tags_storage):
+    tags_storage.update_tags_index(["work", "ideas"], "diary/a.json")
+    tags_storage.update_tags_index(["work"], "diary/a.json")
+    with tags_storage.TAGS_INDEX_LOG.open("ab") as log:
+        log.write(b'{"tag": "work", "fi')
+
+    assert len(tags_storage.TAGS_INDEX_LOG.read_bytes().splitlines()) == 3
+    _reset(tags_storage)
+    assert tags_storage.load_tags_index() == {"work": {"diary/a.json"}, "ideas": {"diary/a.json"}}
+
+    tags_storage.update_tags_index(["work"], "diary/b.json")
+    _reset(tags_storage)
+    assert tags_storage.load_tags_index()["work"] == {"diary/a.json", "diary/b.json"}
+
+
+def test_compaction_keeps_records_from_other_writers(tags_storage):
+    tags_storage.update_tags_index(["work"], "diary/a.json")
+    # Another process appends after this one loaded the index.
+    with tags_storage.TAGS_INDEX_LOG.open("ab") as log:
+        log.write(json.dumps({"tag": "travel", "file": "diary/b.json"}).encode("utf-8") + b"\n")
+
+    tags_storage.compact_tags_index()
+
+    assert not tags_storage.TAGS_INDEX_LOG.exists()
+    assert json.loads(tags_storage.TAGS_INDEX_FILE.read_text()) == {
+        "work": ["diary/a.json"],
+        "travel": ["diary/b.json"],
+    }
+    assert not list(tags_storage.TAGS_INDEX_FILE.parent.glob(".*"))
+    _reset(tags_storage)
+    assert tags_storage.load_tags_index() == {"work": {"diary/a.json"}, "travel": {"diary/b.json"}}
+
+
+def test_save_json_leaves_no_temp_file_on_failure(monkeypatch, tmp_path):
+    target = tmp_path / "facts.json"
+    storage.save_json(target, {"a": 1})
+
+    def _fail(*_args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage.os, "replace", _fail)
+    with pytest.raises(OSError):
+        storage.save_json(target, {"a": 2})
+
+    assert json.loads(target.read_text()) == {"a": 1}
+    assert [path.name for path in tmp_path.iterdir()] == ["facts.json"]
@@ -0,0 +1,102 @@
+import json
+import os
+import threading
+from datetime import datetime
+from zipfile import ZipFile
+
+import pytest
+
+
+def _sync_config(configuration):
+    config = configuration.load_config()
+    configuration.ensure_storage_dirs(config)
+    config["sync"]["dry_run"] = False
+    return config
+
+
+def test_local_backup_contains_encrypted_payload_and_restore_point(reload_modules):
+    configuration = reload_modules["solace.configuration"]
+    journal = reload_modules["journal"]
+    sync = reload_modules["solace.sync"]
+
+    config = _sync_config(configuration)
+    cipher = configuration.get_cipher(config, password="seed")
+    journal.add_entry("Backed up", entry_type="diary", when=datetime(2024, 1, 2, 9, 0), cipher=cipher)
+
+    result = sync.perform_sync(config, backend="local", cipher=cipher)
+
+    assert not result.dry_run
+    assert result.archive.exists()
+    with ZipFile(result.archive) as archive:
+        assert set(archive.namelist()) == {"journal.enc", "metadata.json", "entries.json", "config.json"}
+        restored = json.loads(cipher.decrypt(archive.read("journal.enc")))
+        assert restored[0]["identifier"]
+        assert json.loads(archive.read("metadata.json"))["kind"] == "full"
+
+
+def test_incremental_sync_skips_unchanged_and_sends_delta(reload_modules):
+    configuration = reload_modules["solace.configuration"]
+    journal = reload_modules["journal"]
+    sync = reload_modules["solace.sync"]
+
+    config = _sync_config(configuration)
+    config["sync"]["incremental"] = True
+    cipher = configuration.get_cipher(config, password="seed")
+    journal.add_entry("First", entry_type="diary", when=datetime(2024, 1, 2, 9, 0), cipher=cipher)
+
+    first = sync.perform_sync(config, backend="local", cipher=cipher)
+    assert first.archive.name.startswith("journal-sync-")
+
+    again = sync.perform_sync(config, backend="local", cipher=cipher)
+    assert again.unchanged
+    assert again.archive == first.archive
+
+    journal.add_entry("Second", entry_type="diary", when=datetime(2024, 1, 3, 9, 0), cipher=cipher)
+    delta = sync.perform_sync(config, backend="local", cipher=cipher)
+
+    assert delta.archive.name.startswith("journal-delta-0001-")
+    with ZipFile(delta.archive) as archive:
+        assert "entries-delta.json" in archive.namelist()
+        metadata = json.loads(archive.read("metadata.json"))
+        assert metadata["kind"] == "delta"
+        assert metadata["base_count"] == 1
+        appended = json.loads(cipher.decrypt(archive.read("journal.enc")))
+        assert len(appended) == 1
+        assert cipher.decrypt(appended[0]["content"].encode("utf-8")) == b"Second"
+
+
+def test_pipelined_s3_upload_aborts_on_first_failed_part(reload_modules, tmp_path, monkeypatch):
+    sync = reload_modules["solace.sync"]
+    monkeypatch.setattr(sync, "S3_MULTIPART_CHUNKSIZE", 64 * 1024)
+    monkeypatch.setattr(sync, "ARCHIVE_WRITE_SLICE", 64 * 1024)
+    first_part_failed = threading.Event()
+
+    class FailingClient:
+        def __init__(self):
+            self.parts = []
+            self.aborted = False
+
+        def create_multipart_upload(self, **_kwargs):
+            return {"UploadId": "upload"}
+
+        def upload_part(self, *, PartNumber, **_kwargs):
+            self.parts.append(PartNumber)
+            if PartNumber == 1:
+                first_part_failed.set()
+                raise OSError("connection reset")
+            first_part_failed.wait()
+            return {"ETag": str(PartNumber)}
+
+        def abort_multipart_upload(self, **_kwargs):
+            self.aborted = True
+
+        def complete_multipart_upload(self, **_kwargs):
+            raise AssertionError("upload should not complete")
+
+    client = FailingClient()
+    members = [("journal.enc", os.urandom(4 * 1024 * 1024))]
+    with pytest.raises(OSError, match="connection reset"):
+        sync._upload_s3_pipelined(client, "bucket", "key", tmp_path / "a.zip", members, max_workers=2)
+
+    assert client.aborted
+    assert len(client.parts) < 64 // 2
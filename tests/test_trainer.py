@@ -0,0 +1,41 @@
+import importlib
+import json
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def trainer(reload_modules):
+    sys.modules.pop("trainer", None)
+    return importlib.import_module("trainer")
+
+
+def test_legacy_index_is_migrated_to_json_lines(trainer):
+    trainer.LEGACY_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    legacy = [
+        {"language": "python", "category": "tip", "text": "Use pathlib", "source": "book.txt"},
+        "not a snippet",
+        {"language": "bash", "category": "example", "text": "echo hi", "source": "manual"},
+    ]
+    trainer.LEGACY_INDEX_FILE.write_text(json.dumps(legacy), encoding="utf-8")
+
+    snippets = trainer.load_index()
+
+    assert [snippet.text for snippet in snippets] == ["Use pathlib", "echo hi"]
+    assert not trainer.LEGACY_INDEX_FILE.exists()
+    lines = trainer.INDEX_FILE.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["language"] for line in lines] == ["python", "bash"]
+    assert not list(trainer.INDEX_FILE.parent.glob(".*.tmp"))
+
+
+def test_teach_appends_after_torn_line(trainer):
+    trainer.INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    trainer.INDEX_FILE.write_bytes(
+        b'{"language":"python","category":"tip","text":"first","source":"manual"}\n{"language":"py'
+    )
+
+    trainer.teach("bash", "echo second", category="example")
+
+    assert [snippet.text for snippet in trainer.load_index()] == ["first", "echo second"]
+    assert [snippet.text for snippet in trainer.query(language="bash", prompt="second")] == ["echo second"]
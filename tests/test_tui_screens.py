@@ -0,0 +1,136 @@
+import asyncio
+import importlib
+import sys
+import types
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def screens(reload_modules, monkeypatch):
+    # Import the screens without tui/__init__, which builds the full app.
+    package = types.ModuleType("tui")
+    package.__path__ = [str(Path(__file__).resolve().parent.parent / "tui")]
+    monkeypatch.setitem(sys.modules, "tui", package)
+    for name in ("tui.screens", "tui.controllers"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    module = importlib.import_module("tui.screens")
+    monkeypatch.setattr(module, "RENDER_CHUNK", 10)
+    monkeypatch.setattr(module, "RENDER_MARGIN", 2)
+    return module
+
+
+def _entry(index, content=None):
+    return SimpleNamespace(
+        identifier=f"id-{index}",
+        date="2024-01-02",
+        time="09:05",
+        entry_type="diary",
+        content=content or f"Entry {index}\nmore text",
+        tags=[],
+    )
+
+
+class _Controller:
+    def __init__(self, entries):
+        self.entries = entries
+        self.calls = []
+
+    def list_entries(self, tags=None):
+        self.calls.append(tags)
+        return list(self.entries)
+
+
+def _run_screen(screens, controller, check):
+    from textual.app import App
+
+    class _App(App):
+        def on_mount(self):
+            self.push_screen(screens.JournalListScreen(controller))
+
+    async def main():
+        app = _App()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await check(app.screen, pilot)
+
+    asyncio.run(main())
+
+
+def _shown(screen):
+    return [str(item.query_one("Static").content) for item in screen._entries_widget.children]
+
+
+def test_concurrent_row_syncs_keep_widgets_in_step(screens):
+    controller = _Controller([_entry(index) for index in range(15)])
+
+    async def check(screen, _pilot):
+        controller.entries = [_entry(index) for index in range(0, 30, 2)]
+        await asyncio.gather(screen.refresh_entries(), screen._render_more(), screen.refresh_entries())
+
+        assert _shown(screen) == [content for _, content in screen._rendered_rows]
+        assert [identifier for identifier, _ in screen._rendered_rows] == [
+            entry.identifier for entry in controller.entries[: len(screen._rendered_rows)]
+        ]
+
+    _run_screen(screens, controller, check)
+
+
+def test_tag_filter_submits_are_debounced(screens):
+    controller = _Controller([_entry(index) for index in range(3)])
+
+    async def check(screen, pilot):
+        from textual.widgets import Input
+
+        tag_filter = screen.query_one("#tag-filter", Input)
+        for value in ("w", "wo", "work, home"):
+            screen.on_input_submitted(Input.Submitted(tag_filter, value))
+        await pilot.pause(screens.REFRESH_DEBOUNCE * 3)
+
+        assert controller.calls == [None, ["work", "home"]]
+
+    _run_screen(screens, controller, check)
+
+
+def test_refresh_patches_only_changed_rows(screens):
+    controller = _Controller([_entry(index) for index in range(5)])
+
+    async def check(screen, _pilot):
+        before = list(screen._entries_widget.children)
+        controller.entries = [_entry(9)] + [
+            _entry(index, "Edited") if index == 2 else _entry(index) for index in range(5) if index != 4
+        ]
+        await screen.refresh_entries()
+
+        after = list(screen._entries_widget.children)
+        assert _shown(screen)[0].endswith("Entry 9")
+        assert _shown(screen)[3].endswith("Edited")
+        assert [after[1], after[2], after[4]] == [before[0], before[1], before[3]]
+        assert after[3] is not before[2]
+        assert len(after) == 5
+
+    _run_screen(screens, controller, check)
+
+
+def test_rows_render_in_chunks_near_the_end(screens):
+    controller = _Controller([_entry(index) for index in range(25)])
+
+    async def check(screen, pilot):
+        assert len(screen._entries_widget.children) == 10
+
+        screen._entries_widget.index = 8
+        await pilot.pause()
+        assert len(screen._entries_widget.children) == 20
+
+        screen._entries_widget.index = 5
+        await pilot.pause()
+        assert len(screen._entries_widget.children) == 20
+
+        screen._entries_widget.index = 19
+        await pilot.pause()
+        await screen._render_more()
+        assert len(screen._rendered_rows) == len(screen._entries_widget.children) == 25
+
+    _run_screen(screens, controller, check)
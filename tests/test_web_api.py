@@ -0,0 +1,139 @@
+import importlib
+import sys
+
+import pytest
+
+# The API's pydantic models use PEP 604 unions, which Python 3.9 cannot evaluate.
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 10), reason="web API requires Python 3.10+")
+
+
+@pytest.fixture
+def api(reload_modules):
+    for name in ("trainer", "web.api.main"):
+        sys.modules.pop(name, None)
+    return importlib.import_module("web.api.main")
+
+
+@pytest.fixture
+def client(api):
+    from fastapi.testclient import TestClient
+
+    return TestClient(api.app)
+
+
+def _login(client, password=None):
+    token = client.post("/api/auth/login", json={"password": password}).json()["token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _add(client, headers, content, tags):
+    payload = {"content": content, "entry_type": "diary", "tags": tags}
+    assert client.post("/api/entries", json=payload, headers=headers).status_code == 200
+
+
+def test_unknown_tags_are_not_cached(api, client):
+    headers = _login(client)
+    _add(client, headers, "Morning walk", ["outside"])
+
+    assert client.get("/api/entries?tag=outside", headers=headers).json()[0]["content"] == "Morning walk"
+    for index in range(50):
+        assert client.get(f"/api/entries?tag=missing-{index}", headers=headers).json() == []
+
+    (view,) = api._ENTRIES_CACHE.values()
+    assert set(view._tag_bodies) == {"outside"}
+
+
+def _disable_encryption(configuration):
+    config = configuration.load_config()
+    config["security"]["encryption_enabled"] = False
+    configuration.save_config(config)
+
+
+def test_etag_is_shared_across_sessions_and_changes_with_settings(reload_modules, client):
+    headers = _login(client)
+    _add(client, headers, "Tea with Sam", ["friends"])
+    etag = client.get("/api/entries", headers=headers).headers["etag"]
+
+    other = _login(client)
+    cached = client.get("/api/entries", headers={**other, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert client.get("/api/entries?tag=friends", headers={**other, "If-None-Match": etag}).status_code == 200
+
+    _disable_encryption(reload_modules["solace.configuration"])
+    assert client.post("/api/config/reload", headers=other).status_code == 200
+
+    fresh = client.get("/api/entries", headers={**_login(client), "If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+
+
+def test_exports_are_reused_pruned_and_dropped_on_settings_change(reload_modules, api, client, monkeypatch):
+    headers = _login(client)
+    _add(client, headers, "First", [])
+    first = client.get("/api/entries/export", headers=headers)
+    again = client.get("/api/entries/export", headers=_login(client))
+    assert first.status_code == again.status_code == 200
+    assert first.headers["content-disposition"] == again.headers["content-disposition"]
+    assert len(list(api.EXPORT_CACHE_DIR.glob("export-*"))) == 1
+
+    monkeypatch.setattr(api, "EXPORT_CACHE_KEEP", 2)
+    for index in range(3):
+        _add(client, headers, f"Entry {index}", [])
+        assert client.get("/api/entries/export", headers=headers).status_code == 200
+    assert len(list(api.EXPORT_CACHE_DIR.glob("export-*"))) == 2
+
+    _disable_encryption(reload_modules["solace.configuration"])
+    client.post("/api/config/reload", headers=headers)
+    assert not list(api.EXPORT_CACHE_DIR.glob("export-*"))
+
+
+def test_entries_view_is_shared_and_invalidated_on_write(reload_modules, api, client):
+    headers = _login(client)
+    _add(client, headers, "Walk in the rain", ["outside"])
+    first = client.get("/api/entries", headers=headers).content
+    assert client.get("/api/entries", headers=_login(client)).content == first
+    (view,) = api._ENTRIES_CACHE.values()
+
+    _add(client, headers, "Reading inside", ["inside"])
+    assert [e["content"] for e in client.get("/api/entries", headers=headers).json()] == [
+        "Walk in the rain",
+        "Reading inside",
+    ]
+    assert client.get("/api/tags", headers=headers).json() == ["inside", "outside"]
+    assert next(iter(api._ENTRIES_CACHE.values())) is not view
+
+    # Writes from the CLI or TUI change the journal file and invalidate the view.
+    (cipher,) = api.auth_manager.ciphers.values()
+    reload_modules["journal"].add_entry("From the CLI", entry_type="notes", tags=["outside"], cipher=cipher)
+    outside = client.get("/api/entries?tag=outside", headers=headers).json()
+    assert [e["content"] for e in outside] == ["Walk in the rain", "From the CLI"]
+
+
+def test_sessions_expire_and_least_recently_used_are_dropped(api, client, monkeypatch):
+    monkeypatch.setattr(api, "MAX_SESSIONS", 2)
+    first, second = _login(client), _login(client)
+    assert client.get("/api/tags", headers=first).status_code == 200
+
+    third = _login(client)
+    assert client.get("/api/tags", headers=second).status_code == 401
+    assert client.get("/api/tags", headers=first).status_code == 200
+
+    token = third["Authorization"][len("Bearer "):]
+    api.auth_manager.sessions[token].created_at -= api.SESSION_MAX_AGE + 1
+    assert client.get("/api/tags", headers=third).status_code == 401
+    assert token not in api.auth_manager.sessions
+    assert client.get("/api/tags", headers={"Authorization": "Token abc"}).status_code == 401
+
+
+def test_config_reload_keeps_sessions_unless_security_changes(reload_modules, client):
+    headers = _login(client)
+    unchanged = client.post("/api/config/reload", headers=headers)
+    assert unchanged.json() == {"password_required": "False", "encryption_enabled": "True"}
+    assert client.get("/api/tags", headers=headers).status_code == 200
+
+    _disable_encryption(reload_modules["solace.configuration"])
+    changed = client.post("/api/config/reload", headers=headers)
+    assert changed.json()["encryption_enabled"] == "False"
+    assert client.get("/api/tags", headers=headers).status_code == 401
+    assert client.get("/api/tags", headers=_login(client)).status_code == 200
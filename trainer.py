@@ -3,22 +3,31 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
 import re
-from dataclasses import dataclass, asdict
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from solace.configuration import ensure_storage_dirs, get_storage_path, load_config
+from solace.utils import jsontools
 
 CONFIG = load_config()
 ensure_storage_dirs(CONFIG)
 
 TRAINING_ROOT = get_storage_path(CONFIG, "training")
 BOOKS_DIR = TRAINING_ROOT / "books"
-INDEX_FILE = TRAINING_ROOT / "index.json"
+INDEX_FILE = TRAINING_ROOT / "index.jsonl"
+LEGACY_INDEX_FILE = TRAINING_ROOT / "index.json"
 SESSIONS_DIR = TRAINING_ROOT / "sessions"
 
+# Below this much book text, process start-up costs more than extraction saves.
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
 LANGUAGE_MAP = {
     "python": ["python", "py"],
     "bash": ["bash", "shell", "sh"],
@@ -30,69 +39,145 @@ LANGUAGE_MAP = {
 
 @dataclass
 class KnowledgeSnippet:
+    # Declared by hand (no defaults) so large indexes skip per-instance
+    # __dict__s; dataclass(slots=True) needs Python 3.10.
+    __slots__ = ("language", "category", "text", "source")
+
     language: str
     category: str
     text: str
     source: str
 
     def serialise(self) -> Dict[str, str]:
-        return asdict(self)
+        # Flat record, so build the dict directly rather than via asdict().
+        return {
+            "language": self.language,
+            "category": self.category,
+            "text": self.text,
+            "source": self.source,
+        }
+
 
+_SECTION_SPLIT_RE = re.compile(r"\n{2,}")
+_DEF_RE = re.compile(r"^\s*(def |class |function |var |let |const )", re.IGNORECASE | re.MULTILINE)
+_LANGUAGE_RANK = {lang: rank for rank, lang in enumerate(LANGUAGE_MAP)}
+# One pass over the block finds every keyword hit, including overlapping ones.
+_LANGUAGE_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{lang}>{'|'.join(map(re.escape, keywords))})"
+        for lang, keywords in LANGUAGE_MAP.items()
+    ) + ")"
+)
 
-def _detect_language(block: str) -> Optional[str]:
-    block_lower = block.lower()
-    for lang, keywords in LANGUAGE_MAP.items():
-        if any(keyword in block_lower for keyword in keywords):
-            return lang
-    return None
+
+def _detect_language(block_lower: str) -> Optional[str]:
+    """Return the first ``LANGUAGE_MAP`` language mentioned in a lowercased block."""
+    best = None
+    for match in _LANGUAGE_RE.finditer(block_lower):
+        lang = match.lastgroup
+        if best is None or _LANGUAGE_RANK[lang] < _LANGUAGE_RANK[best]:
+            best = lang
+            if _LANGUAGE_RANK[lang] == 0:
+                break
+    return best
 
 
 def _extract_snippets(text: str, source: str) -> Iterable[KnowledgeSnippet]:
-    sections = re.split(r"\n{2,}", text)
-    for section in sections:
+    for section in _SECTION_SPLIT_RE.split(text):
         cleaned = section.strip()
         if not cleaned:
             continue
-        language = _detect_language(cleaned)
+        cleaned_lower = cleaned.lower()
+        language = _detect_language(cleaned_lower)
         if not language:
             continue
-        if re.search(r"^\s*(def |class |function |var |let |const )", cleaned, re.IGNORECASE | re.MULTILINE):
+        if _DEF_RE.search(cleaned):
             yield KnowledgeSnippet(language, "example", cleaned, source)
-        elif "error" in cleaned.lower():
+        elif "error" in cleaned_lower:
             yield KnowledgeSnippet(language, "error", cleaned, source)
-        elif "tip" in cleaned.lower() or "remember" in cleaned.lower():
+        elif "tip" in cleaned_lower or "remember" in cleaned_lower:
             yield KnowledgeSnippet(language, "tip", cleaned, source)
 
 
+def _snippet_from_dict(item: Dict[str, str]) -> KnowledgeSnippet:
+    return KnowledgeSnippet(
+        language=item.get("language", "unknown"),
+        category=item.get("category", "example"),
+        text=item.get("text", ""),
+        source=item.get("source", "unknown"),
+    )
+
+
+def _write_index(snippets: Iterable[KnowledgeSnippet]) -> None:
+    # Written aside and swapped in, so an interrupted rewrite or migration never
+    # leaves a partial index that _ensure_index would then trust.
+    INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = INDEX_FILE.with_name(f".{INDEX_FILE.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as handle:
+            for snippet in snippets:
+                handle.write(jsontools.dumps_line(snippet.serialise()))
+        os.replace(tmp, INDEX_FILE)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _migrate_legacy_index() -> bool:
+    """Convert an old ``index.json`` list into the JSON Lines index."""
+    if not LEGACY_INDEX_FILE.exists():
+        return False
+    try:
+        data = jsontools.loads(LEGACY_INDEX_FILE.read_bytes())
+    except json.JSONDecodeError:
+        return False
+    _write_index(_snippet_from_dict(item) for item in data if isinstance(item, dict))
+    LEGACY_INDEX_FILE.unlink()
+    return True
+
+
+def _ensure_index() -> None:
+    if not INDEX_FILE.exists() and not _migrate_legacy_index():
+        rebuild_index()
+
+
+def _process_book(book: Path) -> List[KnowledgeSnippet]:
+    text = book.read_text(encoding="utf-8", errors="ignore")
+    return list(_extract_snippets(text, source=book.name))
+
+
 def rebuild_index() -> List[KnowledgeSnippet]:
     BOOKS_DIR.mkdir(parents=True, exist_ok=True)
-    snippets: List[KnowledgeSnippet] = []
-    for book in BOOKS_DIR.glob("*.txt"):
-        text = book.read_text(encoding="utf-8", errors="ignore")
-        for snippet in _extract_snippets(text, source=book.name):
-            snippets.append(snippet)
-    INDEX_FILE.write_text(json.dumps([s.serialise() for s in snippets], indent=2), encoding="utf-8")
+    books = sorted(BOOKS_DIR.glob("*.txt"))
+    workers = min(len(books), os.cpu_count() or 1)
+    if workers > 1 and sum(book.stat().st_size for book in books) >= PARALLEL_MIN_BYTES:
+        # Extraction is CPU-bound regex work, so spread large libraries across
+        # cores. Workers are spawned, not forked: the web API calls this from a
+        # threadpool thread, and forking a threaded process can deadlock.
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            per_book = list(executor.map(_process_book, books))
+    else:
+        per_book = [_process_book(book) for book in books]
+    snippets = [snippet for found in per_book for snippet in found]
+    _write_index(snippets)
     return snippets
 
 
+def iter_index() -> Iterator[KnowledgeSnippet]:
+    """Yield snippets from the index one line at a time."""
+    _ensure_index()
+    with INDEX_FILE.open("rb") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            try:
+                yield _snippet_from_dict(jsontools.loads(line))
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted teach(); skip it.
+                continue
+
+
 def load_index() -> List[KnowledgeSnippet]:
-    if not INDEX_FILE.exists():
-        return rebuild_index()
-    try:
-        data = json.loads(INDEX_FILE.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return rebuild_index()
-    snippets = []
-    for item in data:
-        snippets.append(
-            KnowledgeSnippet(
-                language=item.get("language", "unknown"),
-                category=item.get("category", "example"),
-                text=item.get("text", ""),
-                source=item.get("source", "unknown"),
-            )
-        )
-    return snippets
+    return list(iter_index())
 
 
 def record_session(topic: str, notes: str, *, tags: Optional[List[str]] = None) -> Path:
@@ -109,23 +194,100 @@ def record_session(topic: str, notes: str, *, tags: Optional[List[str]] = None)
     return path
 
 
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _index_stamp():
+    stat = INDEX_FILE.stat()
+    return (str(INDEX_FILE), stat.st_mtime_ns, stat.st_size)
+
+
+class _SnippetSearch:
+    """In-memory language and trigram postings over the loaded index.
+
+    Any substring of three or more characters contains all of its trigrams,
+    so intersecting their postings gives a superset of the matching snippets
+    without scanning every text.
+    """
+
+    def __init__(self, stamp) -> None:
+        self.stamp = stamp
+        self.snippets: List[KnowledgeSnippet] = []
+        self.by_language: Dict[str, List[int]] = defaultdict(list)
+        self.trigrams: Dict[str, set] = defaultdict(set)
+
+    def add(self, snippet: KnowledgeSnippet) -> None:
+        snippet_id = len(self.snippets)
+        self.snippets.append(snippet)
+        self.by_language[snippet.language].append(snippet_id)
+        for trigram in _trigrams(snippet.text.lower()):
+            self.trigrams[trigram].add(snippet_id)
+
+    def candidates(self, language: str, prompt: str) -> Iterable[int]:
+        ids = self.by_language.get(language, [])
+        if len(prompt) < 3:
+            return ids
+        postings = sorted((self.trigrams.get(t, set()) for t in _trigrams(prompt)), key=len)
+        common = set.intersection(*postings)
+        if len(common) < len(ids):
+            return sorted(i for i in common if self.snippets[i].language == language)
+        return [i for i in ids if i in common]
+
+
+_SEARCH: Optional[_SnippetSearch] = None
+
+
+def _search_index() -> _SnippetSearch:
+    global _SEARCH
+    _ensure_index()
+    stamp = _index_stamp()
+    if _SEARCH is None or _SEARCH.stamp != stamp:
+        search = _SnippetSearch(stamp)
+        for snippet in iter_index():
+            search.add(snippet)
+        _SEARCH = search
+    return _SEARCH
+
+
+def list_snippets(language: Optional[str] = None) -> List[KnowledgeSnippet]:
+    """Return indexed snippets, optionally only those for ``language``."""
+    search = _search_index()
+    if language is None:
+        return list(search.snippets)
+    return [search.snippets[i] for i in search.by_language.get(language, ())]
+
+
 def query(language: str, prompt: str, *, limit: int = 5) -> List[KnowledgeSnippet]:
     language = language.lower()
-    snippets = load_index()
+    prompt = prompt.lower()
+    search = _search_index()
     matches: List[KnowledgeSnippet] = []
-    for snippet in snippets:
-        if snippet.language != language:
-            continue
-        if prompt.lower() in snippet.text.lower():
+    for snippet_id in search.candidates(language, prompt):
+        snippet = search.snippets[snippet_id]
+        if prompt in snippet.text.lower():
             matches.append(snippet)
-    return matches[:limit]
+            if len(matches) >= limit:
+                break
+    return matches
 
 
 def teach(language: str, content: str, *, category: str = "example") -> KnowledgeSnippet:
     snippet = KnowledgeSnippet(language=language, category=category, text=content, source="manual")
-    snippets = load_index()
-    snippets.append(snippet)
-    INDEX_FILE.write_text(json.dumps([s.serialise() for s in snippets], indent=2), encoding="utf-8")
+    _ensure_index()
+    current = _SEARCH is not None and _SEARCH.stamp == _index_stamp()
+    with INDEX_FILE.open("a+b") as handle:
+        size = handle.seek(0, os.SEEK_END)
+        if size:
+            handle.seek(size - 1)
+            if handle.read(1) != b"\n":
+                # Start a fresh line after a torn record from an interrupted write.
+                handle.write(b"\n")
+        handle.write(jsontools.dumps_line(snippet.serialise()))
+    if current:
+        # Keep the in-memory postings in step rather than reloading the index.
+        _SEARCH.add(snippet)
+        _SEARCH.stamp = _index_stamp()
     return snippet
 
 
@@ -133,7 +295,9 @@ __all__ = [
     "KnowledgeSnippet",
     "LANGUAGE_MAP",
     "rebuild_index",
+    "iter_index",
     "load_index",
+    "list_snippets",
     "record_session",
     "query",
     "teach",
@@ -2,16 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
-from typing import List
+from difflib import SequenceMatcher
+from typing import List, Optional, Tuple
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.message import Message
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Button, Footer, Header, Input, Label, ListItem, ListView, Static, Switch, TextArea
 
 from tui.controllers import JournalController, SettingsController
 
+# Seconds to wait after a submit before rebuilding a list.
+REFRESH_DEBOUNCE = 0.2
+# Journal rows are mounted in chunks; the next chunk loads when the highlight
+# comes within RENDER_MARGIN rows of the end or the list is scrolled down.
+RENDER_CHUNK = 100
+RENDER_MARGIN = 10
+
+
+def _first_line(content: str) -> str:
+    # Slice up to the first newline rather than splitting the whole entry.
+    end = content.find("\n")
+    return (content if end < 0 else content[:end]).rstrip("\r")
+
+
+def _preview(entry) -> str:
+    """Return the entry's first line, at most 80 characters."""
+    return _first_line(entry.content or "")[:80]
+
+
+def _label(entry) -> str:
+    return f"{entry.date} {entry.time} • {entry.entry_type.title()}"
+
 
 class JournalListScreen(Screen):
     """Display journal entries with optional tag filtering."""
@@ -25,6 +50,9 @@ class JournalListScreen(Screen):
         self.controller = controller
         self.entries: List = []
         self.tag_filter: List[str] = []
+        self._refresh_timer: Optional[Timer] = None
+        self._rendered_rows: List[Tuple[str, str]] = []
+        self._render_limit = RENDER_CHUNK
 
     class RequestTagFilter(Message):
         """Request focusing the tag filter input."""
@@ -42,22 +70,63 @@ class JournalListScreen(Screen):
         )
         yield Footer()
 
-    def on_mount(self) -> None:
-        self.refresh_entries()
-
-    def refresh_entries(self) -> None:
-        entries_widget = self.query_one("#entries", ListView)
-        entries_widget.clear()
+    async def on_mount(self) -> None:
+        self._entries_widget = self.query_one("#entries", ListView)
+        # Held across each diff-and-apply so overlapping refreshes (timer,
+        # highlight, scroll, other screens) never patch against stale rows.
+        # Created here so it belongs to the app's event loop on Python 3.9.
+        self._rows_lock = asyncio.Lock()
+        self.watch(self._entries_widget, "scroll_y", self._on_entries_scrolled, init=False)
+        await self.refresh_entries()
+
+    async def refresh_entries(self) -> None:
+        """Reload entries and patch only the rows that changed."""
         tags = self.tag_filter or None
         self.entries = self.controller.list_entries(tags=tags)
-        for entry in self.entries:
-            preview = entry.content.splitlines()[0][:80] if entry.content else ""
-            label = f"{entry.date} {entry.time} • {entry.entry_type.title()}"
-            content = f"{label}\n{preview}"
-            entries_widget.append(ListItem(Static(content), id=entry.identifier))
+        await self._sync_rows()
+
+    async def _sync_rows(self) -> None:
+        # Only the first ``_render_limit`` entries get widgets; more are
+        # mounted as the user approaches the end of the rendered rows.
+        entries_widget = self._entries_widget
+        async with self._rows_lock:
+            rows = [
+                (entry.identifier, f"{_label(entry)}\n{_preview(entry)}")
+                for entry in self.entries[:self._render_limit]
+            ]
+            opcodes = SequenceMatcher(None, self._rendered_rows, rows, autojunk=False).get_opcodes()
+            # Apply edits back to front so the indices of earlier rows stay valid.
+            for tag, i1, i2, j1, j2 in reversed(opcodes):
+                if tag == "equal":
+                    continue
+                if i2 > i1:
+                    await entries_widget.remove_items(range(i1, i2))
+                if j2 > j1:
+                    await entries_widget.insert(i1, [ListItem(Static(content)) for _, content in rows[j1:j2]])
+            self._rendered_rows = rows
+
+    async def _render_more(self) -> None:
+        if len(self._rendered_rows) >= len(self.entries):
+            return
+        self._render_limit += RENDER_CHUNK
+        await self._sync_rows()
+
+    async def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        index = event.list_view.index
+        if event.list_view.id == "entries" and index is not None and index >= len(self._rendered_rows) - RENDER_MARGIN:
+            await self._render_more()
+
+    def _on_entries_scrolled(self, _scroll_y: float) -> None:
+        # Check after layout so rows mounted just now count towards max_scroll_y.
+        self.call_after_refresh(self._render_more_if_scrolled_to_end)
+
+    async def _render_more_if_scrolled_to_end(self) -> None:
+        entries_widget = self._entries_widget
+        if entries_widget.scroll_y >= entries_widget.max_scroll_y - entries_widget.size.height:
+            await self._render_more()
 
     def action_open_entry(self) -> None:
-        entries_widget = self.query_one("#entries", ListView)
+        entries_widget = self._entries_widget
         if entries_widget.index is None:
             return
         idx = entries_widget.index
@@ -68,15 +137,19 @@ class JournalListScreen(Screen):
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "tag-filter":
             self.tag_filter = [tag.strip() for tag in event.value.split(",") if tag.strip()]
-            self.refresh_entries()
+            self._render_limit = RENDER_CHUNK
+            # Coalesce rapid submits so only the latest filter rebuilds the list.
+            if self._refresh_timer is not None:
+                self._refresh_timer.stop()
+            self._refresh_timer = self.set_timer(REFRESH_DEBOUNCE, self.refresh_entries)
 
     def handle_request_tag_filter(self, _: RequestTagFilter) -> None:  # noqa: D401 - Textual handler
         """Focus the tag filter from an app-level shortcut."""
         self.query_one("#tag-filter", Input).focus()
 
-    def handle_request_refresh(self, _: RequestRefresh) -> None:  # noqa: D401 - Textual handler
+    async def handle_request_refresh(self, _: RequestRefresh) -> None:  # noqa: D401 - Textual handler
         """Refresh list when notified by other screens."""
-        self.refresh_entries()
+        await self.refresh_entries()
 
 
 class EntryDetailScreen(Screen):
@@ -101,6 +174,11 @@ class EntryDetailScreen(Screen):
         )
         yield Footer()
 
+    def on_mount(self) -> None:
+        self._type_input = self.query_one("#entry-type", Input)
+        self._tags_input = self.query_one("#entry-tags", Input)
+        self._content_area = self.query_one("#entry-content", TextArea)
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "cancel":
             self.app.pop_screen()
@@ -109,13 +187,13 @@ class EntryDetailScreen(Screen):
             self.save_entry()
 
     def save_entry(self) -> None:
-        entry_type = self.query_one("#entry-type", Input).value or "diary"
-        tags = [tag.strip() for tag in self.query_one("#entry-tags", Input).value.split(",") if tag.strip()]
-        content = self.query_one("#entry-content", TextArea).value
+        entry_type = self._type_input.value or "diary"
+        tags = [tag.strip() for tag in self._tags_input.value.split(",") if tag.strip()]
+        content = self._content_area.value
         if self.entry is None:
             self.controller.add_entry(entry_type, content, when=datetime.now(), tags=tags)
         else:
-            self.controller.add_entry(entry_type, content, when=datetime.fromisoformat(self.entry.timestamp), tags=tags)
+            self.controller.add_entry(entry_type, content, when=self.entry.when, tags=tags)
         self.app.post_message(JournalListScreen.RequestRefresh())
         self.app.notify("Entry saved", timeout=3)
         self.app.pop_screen()
@@ -128,6 +206,8 @@ class SearchScreen(Screen):
         super().__init__()
         self.controller = controller
         self.results: List = []
+        self._pending_query = ""
+        self._search_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -144,12 +224,18 @@ class SearchScreen(Screen):
         query = event.value.strip()
         if not query:
             return
-        self.results = self.controller.search(query)
+        self._pending_query = query
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(REFRESH_DEBOUNCE, self.run_search)
+
+    def run_search(self) -> None:
+        self.results = self.controller.search(self._pending_query)
         results_widget = self.query_one("#search-results", ListView)
         results_widget.clear()
         for hit in self.results:
-            preview = (hit.snippet or hit.entry.content.splitlines()[0]).strip()[:160]
-            label = f"{hit.entry.date} {hit.entry.time} • {hit.entry.entry_type.title()}"
+            preview = (hit.snippet or _first_line(hit.entry.content)).strip()[:160]
+            label = _label(hit.entry)
             score = f"{hit.score:.2f}" if hasattr(hit, "score") else ""
             results_widget.append(ListItem(Static(f"{label} ({score})\n{preview}")))
 
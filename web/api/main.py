@@ -7,17 +7,26 @@ and call the API directly.
 """
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import hmac
+import os
 import secrets
 import time
-from typing import Dict, List
-
-from fastapi import Depends, FastAPI, Header, HTTPException
+import weakref
+from collections import OrderedDict
+from functools import cached_property
+from itertools import chain
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
 
-from journal import ENTRY_TYPES, add_entry, export_entries, load_entries
+from journal import ENTRIES_FILE, ENTRY_TYPES, JournalEntry, add_entry, export_entries, load_entries
 from solace.configuration import (
     CONFIG_PATH,
     STORAGE_DIR,
@@ -25,7 +34,9 @@ from solace.configuration import (
     is_password_enabled,
     load_config,
 )
-from trainer import load_index, query, rebuild_index, teach
+from solace.utils import jsontools
+from trainer import list_snippets as indexed_snippets
+from trainer import query, rebuild_index, teach
 
 LOCAL_ONLY_NOTICE = (
     "Local-only Solace API. Do not expose this service to networks you do not"
@@ -33,6 +44,29 @@ LOCAL_ONLY_NOTICE = (
 )
 
 CONFIG = load_config()
+_SECURITY: Dict[str, object] = {}
+_PASSWORD_REQUIRED = False
+_ENCRYPTION_ENABLED = True
+_EXPECTED_HASH = ""
+
+
+def _refresh_security() -> None:
+    """Derive the security settings checked on every login from ``CONFIG``."""
+    global _SECURITY, _PASSWORD_REQUIRED, _ENCRYPTION_ENABLED, _EXPECTED_HASH
+    _SECURITY = CONFIG.setdefault("security", {})
+    _PASSWORD_REQUIRED = is_password_enabled(CONFIG)
+    _ENCRYPTION_ENABLED = bool(_SECURITY.get("encryption_enabled", True))
+    _EXPECTED_HASH = str(_SECURITY.get("password_hash") or "")
+
+
+_refresh_security()
+
+# Sessions expire after a day; the least recently used is dropped beyond the cap.
+SESSION_MAX_AGE = 24 * 60 * 60
+MAX_SESSIONS = 128
+
+EXPORT_CACHE_DIR = STORAGE_DIR / "cache"
+EXPORT_CACHE_KEEP = 8
 
 
 class LoginRequest(BaseModel):
@@ -88,22 +122,38 @@ class AuthContext(BaseModel):
     password_used: str | None = None
 
 
+def _cipher_key(security: Dict[str, object]) -> tuple:
+    return (security.get("salt"), security.get("password_enabled"), security.get("password_hash"))
+
+
 class AuthManager:
     """Very small in-memory token store for local-only sessions."""
 
     def __init__(self) -> None:
-        self.sessions: Dict[str, AuthContext] = {}
+        self.sessions: "OrderedDict[str, AuthContext]" = OrderedDict()
+        self.ciphers: Dict[tuple, object] = {}
+
+    def _drop(self, token: str) -> None:
+        self.sessions.pop(token, None)
+
+    def _cipher(self, security: Dict[str, object], password: str | None):
+        # Only the configured password gets this far, so the cipher depends on
+        # the security settings alone; derive the key once, not per login.
+        cipher = self.ciphers.get(_cipher_key(security))
+        if cipher is None:
+            cipher = get_cipher(CONFIG, password=password)
+            # Keyed after derivation: the first call may create the salt.
+            self.ciphers[_cipher_key(security)] = cipher
+        return cipher
 
     def login(self, password: str | None) -> AuthContext:
-        security = CONFIG.get("security", {})
-        if is_password_enabled(CONFIG):
+        if _PASSWORD_REQUIRED:
             hashed = hashlib.sha256((password or "").encode("utf-8")).hexdigest()
-            expected = security.get("password_hash") or ""
-            if hashed != expected:
+            if not hmac.compare_digest(hashed, _EXPECTED_HASH):
                 raise HTTPException(status_code=401, detail="Invalid password")
         cipher = None
-        if security.get("encryption_enabled", True):
-            cipher = get_cipher(CONFIG, password=password)
+        if _ENCRYPTION_ENABLED:
+            cipher = self._cipher(_SECURITY, password)
         token = secrets.token_urlsafe(32)
         context = AuthContext(
             token=token,
@@ -112,12 +162,18 @@ class AuthManager:
             password_used=password,
         )
         self.sessions[token] = context
+        while len(self.sessions) > MAX_SESSIONS:
+            self._drop(next(iter(self.sessions)))
         return context
 
     def get(self, token: str) -> AuthContext:
         context = self.sessions.get(token)
+        if context is not None and time.time() - context.created_at > SESSION_MAX_AGE:
+            self._drop(token)
+            context = None
         if not context:
             raise HTTPException(status_code=401, detail="Missing or expired token")
+        self.sessions.move_to_end(token)
         return context
 
 
@@ -148,11 +204,86 @@ async def root() -> Dict[str, str]:
     }
 
 
+_EMPTY_LIST_BODY = b"[]"
+
+
+class _EntriesView:
+    """Decrypted entries plus values derived from them lazily."""
+
+    def __init__(self, key: tuple, stamp: Tuple[int, int], entries: List[JournalEntry]) -> None:
+        self.key = key
+        self.stamp = stamp
+        self.entries = entries
+        self._tag_bodies: Dict[str, bytes] = {}
+
+    @cached_property
+    def records(self) -> List[Dict[str, object]]:
+        # Validated once per journal revision, then reused as plain dicts.
+        return [EntryResponse(**entry.serialise()).model_dump() for entry in self.entries]
+
+    @cached_property
+    def by_tag(self) -> Dict[str, List[Dict[str, object]]]:
+        index: Dict[str, List[Dict[str, object]]] = {}
+        for entry, record in zip(self.entries, self.records):
+            for tag in dict.fromkeys(entry.tags or ()):
+                index.setdefault(tag, []).append(record)
+        return index
+
+    @cached_property
+    def body(self) -> bytes:
+        return jsontools.dumps(self.records)
+
+    def tag_body(self, tag: str) -> bytes:
+        records = self.by_tag.get(tag)
+        if records is None:
+            # Unknown tags come straight from the client; do not cache them.
+            return _EMPTY_LIST_BODY
+        body = self._tag_bodies.get(tag)
+        if body is None:
+            body = self._tag_bodies[tag] = jsontools.dumps(records)
+        return body
+
+    @cached_property
+    def tags(self) -> List[str]:
+        if "by_tag" in self.__dict__:
+            return sorted(self.by_tag)
+        # /api/tags alone should not pay for validating every entry.
+        return sorted(set(chain.from_iterable(entry.tags or () for entry in self.entries)))
+
+
+# Every session passes the same password check and so decrypts with the same
+# key; views are shared per cipher setting and tagged with the journal file's
+# (mtime_ns, size) so edits from the CLI or TUI invalidate them.
+_ENTRIES_CACHE: Dict[tuple, _EntriesView] = {}
+
+
+def _journal_stamp() -> Tuple[int, int]:
+    try:
+        stat = ENTRIES_FILE.stat()
+    except FileNotFoundError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _entries_view(context: AuthContext) -> _EntriesView:
+    """Return the decrypted entries, reloading only when the journal changed.
+
+    Views are shared between requests and sessions, so callers must not
+    mutate them.
+    """
+    stamp = _journal_stamp()
+    key = (context.cipher is not None, *_cipher_key(_SECURITY))
+    view = _ENTRIES_CACHE.get(key)
+    if view is None or view.stamp != stamp:
+        entries = load_entries(cipher=context.cipher, password=context.password_used)
+        view = _ENTRIES_CACHE[key] = _EntriesView(key, stamp, entries)
+    return view
+
+
 def _get_context(authorization: str = Header(...)) -> AuthContext:
-    if not authorization.startswith("Bearer "):
+    if authorization[:7] != "Bearer ":
         raise HTTPException(status_code=401, detail="Use Bearer token auth")
-    token = authorization.split(" ", 1)[1]
-    return auth_manager.get(token)
+    return auth_manager.get(authorization[7:])
 
 
 @app.post("/api/auth/login", response_model=LoginResponse)
@@ -161,17 +292,36 @@ async def login(payload: LoginRequest) -> LoginResponse:
     return LoginResponse(
         token=context.token,
         local_only=LOCAL_ONLY_NOTICE,
-        requires_password=is_password_enabled(CONFIG),
+        requires_password=_PASSWORD_REQUIRED,
     )
 
 
+def _entries_etag(view: _EntriesView, tag: str | None) -> str:
+    # Covers the security settings the view was decrypted under, the journal
+    # revision and the filter; all sessions with those settings see the same bytes.
+    raw = f"{view.key!r}-{view.stamp[0]}-{view.stamp[1]}-{tag or ''}"
+    return f'W/"{hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = {value.strip() for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or etag[2:] in candidates
+
+
 @app.get("/api/entries", response_model=List[EntryResponse])
-async def list_entries(tag: str | None = None, context: AuthContext = Depends(_get_context)) -> List[EntryResponse]:
-    entries = load_entries(cipher=context.cipher, password=context.password_used)
-    filtered = entries
-    if tag:
-        filtered = [entry for entry in entries if tag in (entry.tags or [])]
-    return [EntryResponse(**entry.serialise()) for entry in filtered]
+async def list_entries(
+    tag: str | None = None,
+    if_none_match: str | None = Header(None),
+    context: AuthContext = Depends(_get_context),
+) -> Response:
+    # Return the view's pre-encoded JSON, skipping per-request model
+    # validation and serialisation.
+    view = _entries_view(context)
+    etag = _entries_etag(view, tag)
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    body = view.tag_body(tag) if tag else view.body
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @app.post("/api/entries", response_model=EntryResponse)
@@ -185,25 +335,58 @@ async def create_entry(payload: EntryRequest, context: AuthContext = Depends(_ge
         cipher=context.cipher,
         password=context.password_used,
     )
+    _ENTRIES_CACHE.clear()
     return EntryResponse(**entry.serialise())
 
 
 @app.get("/api/tags", response_model=List[str])
 async def list_tags(context: AuthContext = Depends(_get_context)) -> List[str]:
-    entries = load_entries(cipher=context.cipher, password=context.password_used)
-    tags = set()
-    for entry in entries:
-        tags.update(entry.tags or [])
-    return sorted(tags)
+    return list(_entries_view(context).tags)
+
+
+# One lock per export file so concurrent requests do not write it twice.
+_EXPORT_LOCKS: "weakref.WeakValueDictionary[Path, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _write_export(destination: Path, format: str, entries: List[JournalEntry]) -> None:
+    EXPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    partial = destination.with_name(f".{destination.name}.tmp")
+    export_entries(partial, format=format, entries=entries)
+    os.replace(partial, destination)
+
+
+def _prune_exports(keep: int | None = None) -> None:
+    """Keep only the most recent ``keep`` (default ``EXPORT_CACHE_KEEP``) cached exports."""
+    keep = EXPORT_CACHE_KEEP if keep is None else keep
+    exports = sorted(
+        EXPORT_CACHE_DIR.glob("export-*"),
+        key=lambda path: path.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for stale in exports[keep:]:
+        stale.unlink(missing_ok=True)
 
 
 @app.get("/api/entries/export")
-async def export(format: str = "markdown", context: AuthContext = Depends(_get_context)) -> FileResponse:
-    timestamp = int(time.time())
+async def export(
+    background_tasks: BackgroundTasks,
+    format: str = "markdown",
+    context: AuthContext = Depends(_get_context),
+) -> FileResponse:
+    # Loading (decrypting) and writing the journal run in the threadpool so
+    # other requests are not stalled behind a large export.
+    view = await run_in_threadpool(_entries_view, context)
     suffix = "md" if format.lower() in {"markdown", "md"} else format.lower()
-    destination = STORAGE_DIR / "cache" / f"export-{timestamp}.{suffix}"
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    export_entries(destination, format=format, cipher=context.cipher, password=context.password_used)
+    # Named after the security settings and journal revision, so re-exporting
+    # an unchanged journal reuses the file.
+    settings = hashlib.sha256(repr(view.key).encode("utf-8")).hexdigest()[:12]
+    destination = EXPORT_CACHE_DIR / f"export-{settings}-{view.stamp[0]}-{view.stamp[1]}.{suffix}"
+    if not destination.exists():
+        lock = _EXPORT_LOCKS.setdefault(destination, asyncio.Lock())
+        async with lock:
+            if not destination.exists():
+                await run_in_threadpool(_write_export, destination, format, view.entries)
+                background_tasks.add_task(_prune_exports)
     headers = {"X-Solace-Local": LOCAL_ONLY_NOTICE}
     media_type = "text/markdown" if suffix in {"md", "markdown"} else "application/octet-stream"
     return FileResponse(destination, filename=destination.name, media_type=media_type, headers=headers)
@@ -211,13 +394,8 @@ async def export(format: str = "markdown", context: AuthContext = Depends(_get_c
 
 @app.get("/api/snippets", response_model=List[SnippetResponse])
 async def list_snippets(language: str | None = None, context: AuthContext = Depends(_get_context)) -> List[SnippetResponse]:
-    snippets = load_index()
-    results = []
-    for snippet in snippets:
-        if language and snippet.language != language:
-            continue
-        results.append(SnippetResponse(**snippet.serialise()))
-    return results
+    snippets = indexed_snippets(language or None)
+    return [SnippetResponse(**snippet.serialise()) for snippet in snippets]
 
 
 @app.get("/api/snippets/search", response_model=List[SnippetResponse])
@@ -237,7 +415,8 @@ async def create_snippet(payload: SnippetRequest, context: AuthContext = Depends
 
 @app.post("/api/snippets/rebuild", response_model=List[SnippetResponse])
 async def rebuild(context: AuthContext = Depends(_get_context)) -> List[SnippetResponse]:
-    snippets = rebuild_index()
+    # Rebuilding reads every book and may start worker processes; keep it off the event loop.
+    snippets = await run_in_threadpool(rebuild_index)
     return [SnippetResponse(**s.serialise()) for s in snippets]
 
 
@@ -247,11 +426,42 @@ async def meta(context: AuthContext = Depends(_get_context)) -> Dict[str, str]:
         "local_only": LOCAL_ONLY_NOTICE,
         "storage_root": str(STORAGE_DIR),
         "config_path": str(CONFIG_PATH),
-        "password_required": str(is_password_enabled(CONFIG)),
+        "password_required": str(_PASSWORD_REQUIRED),
+    }
+
+
+@app.post("/api/config/reload", response_model=Dict[str, str])
+async def reload_config(context: AuthContext = Depends(_get_context)) -> Dict[str, str]:
+    """Re-read the Solace config after it was changed by the CLI or TUI."""
+    global CONFIG
+    previous = (_PASSWORD_REQUIRED, _ENCRYPTION_ENABLED, _EXPECTED_HASH, _cipher_key(_SECURITY))
+    CONFIG = load_config()
+    _refresh_security()
+    if previous != (_PASSWORD_REQUIRED, _ENCRYPTION_ENABLED, _EXPECTED_HASH, _cipher_key(_SECURITY)):
+        # Sessions, views and exports were authorised and decrypted under the
+        # old settings; clients must log in again.
+        auth_manager.sessions.clear()
+        auth_manager.ciphers.clear()
+        _ENTRIES_CACHE.clear()
+        await run_in_threadpool(_prune_exports, 0)
+    return {
+        "password_required": str(_PASSWORD_REQUIRED),
+        "encryption_enabled": str(_ENCRYPTION_ENABLED),
     }
 
 
 if __name__ == "__main__":
+    import importlib.util
+
     import uvicorn
 
-    uvicorn.run("web.api.main:app", host="0.0.0.0", port=8000, reload=True)
+    # uvloop and httptools ship with uvicorn[standard] (uvloop not on Windows);
+    # fall back to the pure-Python stack when they are missing.
+    uvicorn.run(
+        "web.api.main:app",
+        host="127.0.0.1",
+        port=8000,
+        reload=True,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+    )
@@ -11,7 +11,7 @@ echo "Starting Solace local stack (API on $API_PORT, frontend on $UI_PORT)"
 
 echo "API and UI are for local use only. Do not expose externally."
 
-uvicorn web.api.main:app --reload --host 0.0.0.0 --port "$API_PORT" &
+uvicorn web.api.main:app --reload --host 127.0.0.1 --port "$API_PORT" &
 API_PID=$!
 
 cd "$ROOT_DIR/web/frontend"